@@ -3,21 +3,27 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import ssl
+import threading
 import time
-from collections.abc import Iterator
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any
 
 import httpx
 
 from github_api_client.auth import get_token
-from github_api_client.exceptions import (
-    AuthenticationError,
-    GitHubError,
-    NotFoundError,
-    RateLimitError,
-    ValidationError,
-)
 from github_api_client.repo import AsyncRepo, Repo
+from github_api_client.resources.base import (
+    _handle_error_response,
+    _loads_json,
+    _page_url,
+    _parse_json,
+)
 from github_api_client.resources.issues import AsyncIssuesResource, IssuesResource
 from github_api_client.resources.pulls import AsyncPullsResource, PullsResource
 from github_api_client.resources.releases import AsyncReleasesResource, ReleasesResource
@@ -25,36 +31,40 @@ from github_api_client.resources.repos import AsyncReposResource, ReposResource
 from github_api_client.resources.search import AsyncSearchResource, SearchResource
 from github_api_client.resources.users import AsyncUsersResource, UsersResource
 
-BASE_URL = "https://api.github.com"
-_UNSET = object()  # Sentinel to distinguish None from "not provided"
+# HTTP/2 is used by default when the h2 package (the http2 extra) is installed
+try:
+    import h2  # noqa: F401
 
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
 
-def _handle_error_response(response: httpx.Response) -> None:
-    """Raise appropriate exception for error responses."""
-    status_code = response.status_code
-    try:
-        data = response.json()
-        message = data.get("message", response.text)
-    except Exception:
-        data = {}
-        message = response.text
-
-    if status_code == 401:
-        raise AuthenticationError(message, status_code, data)
-    elif status_code == 404:
-        raise NotFoundError(message, status_code, data)
-    elif status_code in (403, 429):
-        reset_at = response.headers.get("X-RateLimit-Reset")
-        raise RateLimitError(
-            message,
-            status_code,
-            data,
-            reset_at=int(reset_at) if reset_at else None,
-        )
-    elif status_code == 422:
-        raise ValidationError(message, status_code, data)
-    else:
-        raise GitHubError(message, status_code, data)
+BASE_URL = "https://api.github.com"
+_UNSET = object()  # Sentinel to distinguish None from "not provided"
+_BATCH_WORKERS = 8  # Default concurrent page requests when paginating with batch=True
+# Keep idle connections alive between pages (httpx default is 5s), so a slow
+# consumer of a paginated iterator doesn't pay for a new TLS handshake per page.
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+_ETAG_CACHE_SIZE = 256  # Responses kept for conditional GET requests
+# Wait before the first retry when GitHub gives no hint, doubled per retry up
+# to _MAX_RETRY_WAIT (GitHub advises waiting at least a minute)
+_DEFAULT_RETRY_WAIT = 60.0
+_MAX_RETRY_WAIT = 120.0
+_RETRY_JITTER = 0.5  # Up to 50% added, so throttled requests don't retry in lockstep
+_ssl_contexts: dict[bool, ssl.SSLContext] = {}
+
+
+def _get_ssl_context(http2: bool) -> ssl.SSLContext:
+    """Get the SSL context shared by all clients with the same HTTP/2 setting.
+
+    Loading the CA bundle takes ~20ms, so it is done once rather than per
+    client. httpcore sets the ALPN protocols on the context it is given, which
+    is why clients with and without HTTP/2 don't share one.
+    """
+    context = _ssl_contexts.get(http2)
+    if context is None:
+        context = _ssl_contexts[http2] = httpx.create_ssl_context()
+    return context
 
 
 def _is_rate_limit_error(response: httpx.Response) -> bool:
@@ -73,8 +83,36 @@ def _is_rate_limit_error(response: httpx.Response) -> bool:
         return response.status_code == 429
 
 
-def _get_retry_after(response: httpx.Response) -> float:
-    """Get seconds to wait before retrying."""
+def _get_last_page(response: httpx.Response) -> int | None:
+    """Get the last page number from the Link header, if present."""
+    last = response.links.get("last")
+    if last is None:
+        return None
+    page = httpx.URL(last["url"]).params.get("page")
+    return int(page) if page else None
+
+
+def _rate_limit_resource(path: str) -> str:
+    """Get the rate limit bucket that GitHub charges a request path to."""
+    if path.startswith("/search/"):
+        return "search"
+    if path.startswith("/graphql"):
+        return "graphql"
+    return "core"
+
+
+def _get_exhausted_until(response: httpx.Response) -> float | None:
+    """Get the reset time if the response used the last request of its limit."""
+    if response.headers.get("X-RateLimit-Remaining") != "0":
+        return None
+    try:
+        return float(response.headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _get_retry_after(response: httpx.Response, attempt: int = 0) -> float:
+    """Get seconds to wait before retry number attempt (counting from 0)."""
     # Check Retry-After header first
     retry_after = response.headers.get("Retry-After")
     if retry_after:
@@ -93,8 +131,9 @@ def _get_retry_after(response: httpx.Response) -> float:
         except ValueError:
             pass
 
-    # Default wait time
-    return 60
+    # No hint: back off exponentially, as GitHub advises for secondary limits
+    wait = min(_MAX_RETRY_WAIT, _DEFAULT_RETRY_WAIT * 2.0**attempt)
+    return wait * (1 + random.random() * _RETRY_JITTER)
 
 
 class GitHub:
@@ -120,6 +159,10 @@ class GitHub:
         timeout: float = 30.0,
         auto_retry: bool = False,
         max_retries: int = 3,
+        search_cache_ttl: float | None = None,
+        http2: bool | None = None,
+        page_concurrency: int = _BATCH_WORKERS,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         """Initialize the GitHub client.
 
@@ -132,6 +175,15 @@ class GitHub:
             timeout: Request timeout in seconds.
             auto_retry: Automatically retry on rate limit errors.
             max_retries: Maximum number of retries for rate limits.
+            search_cache_ttl: Seconds to reuse the results of a fully read
+                search query (default: no caching).
+            http2: Use HTTP/2, so concurrent requests share one connection
+                (default: when the http2 extra is installed).
+            page_concurrency: Maximum page requests in flight when
+                paginating with batch=True.
+            transport: Transport to send requests through, so several clients
+                can share one connection pool. It is not closed with this
+                client, and http2 has no effect when it is given.
         """
         # Auto-detect token if not provided
         if token is _UNSET:
@@ -143,14 +195,32 @@ class GitHub:
         }
         if token:
             headers["Authorization"] = f"Bearer {token}"
-
-        self._client = httpx.Client(
-            base_url=base_url,
-            headers=headers,
-            timeout=timeout,
-        )
+        if http2 is None:
+            http2 = HAS_H2
+
+        # The httpx client is built on first request, see _client
+        self._client_kwargs: dict[str, Any] = {
+            "base_url": base_url,
+            "headers": headers,
+            "timeout": timeout,
+            "http2": http2,
+            "transport": transport,
+        }
+        self._http_client: httpx.Client | None = None
+        # Resource calls may fan out to threads, which must not each build one
+        self._client_lock = threading.Lock()
+        self._closed = False
+        self._owns_transport = transport is None
         self._auto_retry = auto_retry
         self._max_retries = max_retries
+        self._search_cache_ttl = search_cache_ttl
+        self._page_concurrency = page_concurrency
+        # Reset time of each rate limit resource seen exhausted, e.g. "core"
+        self._rate_limit_resets: dict[str, float] = {}
+        # Bodies are kept as bytes and decoded per call, so callers never share
+        # (and can't alter each other's) results
+        self._etag_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._repos: weakref.WeakValueDictionary[str, Repo] = weakref.WeakValueDictionary()
 
         # Initialize resource handlers
         self.repos = ReposResource(self)
@@ -179,29 +249,126 @@ class GitHub:
         Raises:
             GitHubError: On API errors.
         """
+        response = self._send(method, path, **kwargs)
+        if response.status_code >= 400:
+            _handle_error_response(response)
+
+        if response.status_code == 204:
+            return None
+        return _parse_json(response)
+
+    def request_status(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> int:
+        """Make an API request and return only its status code.
+
+        Intended for endpoints that answer a yes/no question with 204 or 404,
+        such as "is this PR merged?". A 404 is returned rather than raised.
+
+        Args:
+            method: HTTP method (GET, HEAD, etc.).
+            path: API endpoint path.
+            **kwargs: Additional arguments passed to httpx.
+
+        Returns:
+            HTTP status code of the response.
+
+        Raises:
+            GitHubError: On API errors other than 404.
+        """
+        response = self._send(method, path, **kwargs)
+        if response.status_code >= 400 and response.status_code != 404:
+            _handle_error_response(response)
+        return response.status_code
+
+    def request_cached(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Make a conditional GET request, reusing the cached body on 304.
+
+        The ETag of each response is sent back as If-None-Match on the next
+        request for the same URL. GitHub answers 304 Not Modified when nothing
+        changed, which doesn't count against the rate limit.
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters.
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            GitHubError: On API errors.
+        """
+        key = str(httpx.URL(path, params=params))
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = self._send("GET", path, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            self._etag_cache.move_to_end(key)
+            return _loads_json(cached[1])
+        if response.status_code >= 400:
+            _handle_error_response(response)
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[key] = (etag, response.content)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return _parse_json(response)
+
+    def _get_page(self, method: str, page_url: str, page: int, **kwargs: Any) -> httpx.Response:
+        """Fetch a single page of a paginated endpoint, given its _page_url."""
+        response = self._send(method, f"{page_url}{page}", **kwargs)
+        if response.status_code >= 400:
+            _handle_error_response(response)
+        return response
+
+    def _send(self, method: str, path: str, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying on rate limits if auto_retry is enabled.
+
+        With stream=True the body of a successful response is left unread, and
+        the caller must close the response.
+        """
         retries = 0
+        resource = _rate_limit_resource(path)
         while True:
-            response = self._client.request(method, path, **kwargs)
-
-            if response.status_code >= 400:
-                # Handle rate limiting with auto-retry
-                if self._auto_retry and _is_rate_limit_error(response):
-                    if retries < self._max_retries:
-                        wait_time = _get_retry_after(response)
-                        time.sleep(wait_time)
-                        retries += 1
-                        continue
-                _handle_error_response(response)
-
-            if response.status_code == 204:
-                return None
-            return response.json()
+            if self._auto_retry:
+                # Wait out an exhausted limit rather than send a request bound to fail
+                wait_time = self._rate_limit_resets.get(resource, 0) - time.time()
+                if wait_time > 0:
+                    time.sleep(wait_time)
+            request = self._client.build_request(method, path, **kwargs)
+            response = self._client.send(request, stream=stream)
+            if stream and response.status_code >= 400:
+                # Error bodies are small and needed to tell rate limits apart
+                response.read()
+            if self._auto_retry:
+                reset_at = _get_exhausted_until(response)
+                if reset_at is not None:
+                    self._rate_limit_resets[resource] = reset_at
+
+            # Handle rate limiting with auto-retry
+            if (
+                response.status_code >= 400
+                and self._auto_retry
+                and _is_rate_limit_error(response)
+                and retries < self._max_retries
+            ):
+                wait_time = _get_retry_after(response, retries)
+                time.sleep(wait_time)
+                retries += 1
+                continue
+            return response
 
     def paginate(
         self,
         method: str,
         path: str,
         per_page: int = 30,
+        batch: bool = False,
         **kwargs: Any,
     ) -> Iterator[Any]:
         """Iterate through paginated results.
@@ -210,6 +377,9 @@ class GitHub:
             method: HTTP method.
             path: API endpoint path.
             per_page: Results per page (max 100).
+            batch: Fetch the remaining pages concurrently once the first
+                page's Link header reveals the last page, otherwise page
+                through them sequentially.
             **kwargs: Additional arguments passed to httpx.
 
         Yields:
@@ -217,29 +387,52 @@ class GitHub:
         """
         params = kwargs.pop("params", {})
         params["per_page"] = min(per_page, 100)
+        page_url = _page_url(path, params)
         page = 1
 
-        while True:
-            params["page"] = page
-            retries = 0
-            while True:
-                response = self._client.request(method, path, params=params, **kwargs)
-
-                if response.status_code >= 400:
-                    if self._auto_retry and _is_rate_limit_error(response):
-                        if retries < self._max_retries:
-                            wait_time = _get_retry_after(response)
-                            time.sleep(wait_time)
-                            retries += 1
-                            continue
-                    _handle_error_response(response)
-                break
+        if batch:
+            response = self._get_page(method, page_url, page, **kwargs)
+            items = _parse_json(response)
+            yield from items
+            last_page = _get_last_page(response)
+            if last_page is not None:
+                pages = iter(range(2, last_page + 1))
+                with ThreadPoolExecutor(max_workers=self._page_concurrency) as executor:
+                    # A sliding window: at most page_concurrency pages are in
+                    # flight or waiting to be read, however slow the consumer
+                    window = deque(
+                        executor.submit(self._get_page, method, page_url, page, **kwargs)
+                        for page in islice(pages, self._page_concurrency)
+                    )
+                    try:
+                        while window:
+                            response = window.popleft().result()
+                            for page in islice(pages, 1):
+                                window.append(
+                                    executor.submit(
+                                        self._get_page, method, page_url, page, **kwargs
+                                    )
+                                )
+                            yield from _parse_json(response)
+                    finally:
+                        for future in window:
+                            future.cancel()
+                return
+            if not items or (response.links and "next" not in response.links):
+                return
+            # No last page advertised; continue sequentially
+            page = 2
 
-            items = response.json()
+        while True:
+            response = self._get_page(method, page_url, page, **kwargs)
+            items = _parse_json(response)
             if not items:
                 break
 
             yield from items
+            # A Link header without rel="next" marks the last page
+            if response.links and "next" not in response.links:
+                break
             page += 1
 
     def repo(self, owner: str, name: str | None = None) -> Repo:
@@ -262,7 +455,12 @@ class GitHub:
             if "/" not in owner:
                 raise ValueError("Must provide repo name or use 'owner/repo' format")
             owner, name = owner.split("/", 1)
-        return Repo(self, owner, name)
+        # Repeat calls for a repo still in use return the same object
+        full_name = f"{owner}/{name}"
+        repo = self._repos.get(full_name)
+        if repo is None:
+            repo = self._repos[full_name] = Repo(self, owner, name)
+        return repo
 
     def rate_limit(self) -> dict[str, Any]:
         """Get current rate limit status.
@@ -272,9 +470,29 @@ class GitHub:
         """
         return self.request("GET", "/rate_limit")
 
+    @property
+    def _client(self) -> httpx.Client:
+        """HTTP client, built on first use so unused clients cost nothing."""
+        client = self._http_client
+        if client is None or self._closed:
+            with self._client_lock:
+                if self._closed:
+                    raise RuntimeError("Cannot send a request, as the client has been closed.")
+                if self._http_client is None:
+                    http2 = self._client_kwargs["http2"]
+                    self._http_client = httpx.Client(
+                        **self._client_kwargs, limits=_LIMITS, verify=_get_ssl_context(http2)
+                    )
+                client = self._http_client
+        return client
+
     def close(self) -> None:
         """Close the HTTP client."""
-        self._client.close()
+        with self._client_lock:
+            self._closed = True
+            # Closing the httpx client would close a transport we were given
+            if self._owns_transport and self._http_client is not None:
+                self._http_client.close()
 
     def __enter__(self) -> GitHub:
         return self
@@ -307,6 +525,10 @@ class AsyncGitHub:
         timeout: float = 30.0,
         auto_retry: bool = False,
         max_retries: int = 3,
+        search_cache_ttl: float | None = None,
+        http2: bool | None = None,
+        page_concurrency: int = _BATCH_WORKERS,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Initialize the async GitHub client.
 
@@ -319,6 +541,15 @@ class AsyncGitHub:
             timeout: Request timeout in seconds.
             auto_retry: Automatically retry on rate limit errors.
             max_retries: Maximum number of retries for rate limits.
+            search_cache_ttl: Seconds to reuse the results of a fully read
+                search query (default: no caching).
+            http2: Use HTTP/2, so concurrent requests share one connection
+                (default: when the http2 extra is installed).
+            page_concurrency: Maximum page requests in flight when
+                paginating with batch=True.
+            transport: Transport to send requests through, so several clients
+                can share one connection pool. It is not closed with this
+                client, and http2 has no effect when it is given.
         """
         # Auto-detect token if not provided
         if token is _UNSET:
@@ -330,14 +561,31 @@ class AsyncGitHub:
         }
         if token:
             headers["Authorization"] = f"Bearer {token}"
-
-        self._client = httpx.AsyncClient(
-            base_url=base_url,
-            headers=headers,
-            timeout=timeout,
-        )
+        if http2 is None:
+            http2 = HAS_H2
+
+        # The httpx client is built on first request, see _client
+        self._client_kwargs: dict[str, Any] = {
+            "base_url": base_url,
+            "headers": headers,
+            "timeout": timeout,
+            "http2": http2,
+            "transport": transport,
+        }
+        self._http_client: httpx.AsyncClient | None = None
+        self._closed = False
+        self._owns_transport = transport is None
         self._auto_retry = auto_retry
         self._max_retries = max_retries
+        self._search_cache_ttl = search_cache_ttl
+        self._page_concurrency = page_concurrency
+        # Reset time of each rate limit resource seen exhausted, e.g. "core"
+        self._rate_limit_resets: dict[str, float] = {}
+        # Bodies are kept as bytes and decoded per call, so callers never share
+        # (and can't alter each other's) results
+        self._etag_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._repos: weakref.WeakValueDictionary[str, AsyncRepo] = weakref.WeakValueDictionary()
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
 
         # Initialize resource handlers
         self.repos = AsyncReposResource(self)
@@ -366,37 +614,153 @@ class AsyncGitHub:
         Raises:
             GitHubError: On API errors.
         """
+        response = await self._send(method, path, **kwargs)
+        if response.status_code >= 400:
+            _handle_error_response(response)
+
+        if response.status_code == 204:
+            return None
+        return _parse_json(response)
+
+    async def request_status(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> int:
+        """Make an async API request and return only its status code.
+
+        Intended for endpoints that answer a yes/no question with 204 or 404,
+        such as "is this PR merged?". A 404 is returned rather than raised.
+
+        Args:
+            method: HTTP method (GET, HEAD, etc.).
+            path: API endpoint path.
+            **kwargs: Additional arguments passed to httpx.
+
+        Returns:
+            HTTP status code of the response.
+
+        Raises:
+            GitHubError: On API errors other than 404.
+        """
+        response = await self._send(method, path, **kwargs)
+        if response.status_code >= 400 and response.status_code != 404:
+            _handle_error_response(response)
+        return response.status_code
+
+    async def request_cached(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Make a conditional GET request, reusing the cached body on 304.
+
+        The ETag of each response is sent back as If-None-Match on the next
+        request for the same URL. GitHub answers 304 Not Modified when nothing
+        changed, which doesn't count against the rate limit. Concurrent calls
+        for the same URL share a single request.
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters.
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            GitHubError: On API errors.
+        """
+        key = str(httpx.URL(path, params=params))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_cached(key, path, params))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller being cancelled doesn't cancel the others; each
+        # decodes its own copy of the shared body
+        return _loads_json(await asyncio.shield(future))
+
+    async def _fetch_cached(self, key: str, path: str, params: dict[str, Any] | None) -> bytes:
+        """Send the conditional GET behind request_cached, returning the body."""
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = await self._send("GET", path, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            self._etag_cache.move_to_end(key)
+            return cached[1]
+        if response.status_code >= 400:
+            _handle_error_response(response)
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[key] = (etag, response.content)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return response.content
+
+    async def _get_page(
+        self, method: str, page_url: str, page: int, **kwargs: Any
+    ) -> httpx.Response:
+        """Fetch a single page of a paginated endpoint, given its _page_url."""
+        response = await self._send(method, f"{page_url}{page}", **kwargs)
+        if response.status_code >= 400:
+            _handle_error_response(response)
+        return response
+
+    async def _send(
+        self, method: str, path: str, stream: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, retrying on rate limits if auto_retry is enabled.
+
+        With stream=True the body of a successful response is left unread, and
+        the caller must close the response.
+        """
         retries = 0
+        resource = _rate_limit_resource(path)
         while True:
-            response = await self._client.request(method, path, **kwargs)
-
-            if response.status_code >= 400:
-                # Handle rate limiting with auto-retry
-                if self._auto_retry and _is_rate_limit_error(response):
-                    if retries < self._max_retries:
-                        wait_time = _get_retry_after(response)
-                        await asyncio.sleep(wait_time)
-                        retries += 1
-                        continue
-                _handle_error_response(response)
-
-            if response.status_code == 204:
-                return None
-            return response.json()
+            if self._auto_retry:
+                # Wait out an exhausted limit rather than send a request bound to fail
+                wait_time = self._rate_limit_resets.get(resource, 0) - time.time()
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
+            request = self._client.build_request(method, path, **kwargs)
+            response = await self._client.send(request, stream=stream)
+            if stream and response.status_code >= 400:
+                # Error bodies are small and needed to tell rate limits apart
+                await response.aread()
+            if self._auto_retry:
+                reset_at = _get_exhausted_until(response)
+                if reset_at is not None:
+                    self._rate_limit_resets[resource] = reset_at
+
+            # Handle rate limiting with auto-retry
+            if (
+                response.status_code >= 400
+                and self._auto_retry
+                and _is_rate_limit_error(response)
+                and retries < self._max_retries
+            ):
+                wait_time = _get_retry_after(response, retries)
+                await asyncio.sleep(wait_time)
+                retries += 1
+                continue
+            return response
 
     async def paginate(
         self,
         method: str,
         path: str,
         per_page: int = 30,
+        batch: bool = False,
         **kwargs: Any,
-    ) -> Any:
+    ) -> AsyncIterator[Any]:
         """Iterate through paginated results asynchronously.
 
         Args:
             method: HTTP method.
             path: API endpoint path.
             per_page: Results per page (max 100).
+            batch: Fetch the remaining pages concurrently once the first
+                page's Link header reveals the last page, otherwise page
+                through them sequentially.
             **kwargs: Additional arguments passed to httpx.
 
         Yields:
@@ -404,30 +768,54 @@ class AsyncGitHub:
         """
         params = kwargs.pop("params", {})
         params["per_page"] = min(per_page, 100)
+        page_url = _page_url(path, params)
         page = 1
 
-        while True:
-            params["page"] = page
-            retries = 0
-            while True:
-                response = await self._client.request(method, path, params=params, **kwargs)
-
-                if response.status_code >= 400:
-                    if self._auto_retry and _is_rate_limit_error(response):
-                        if retries < self._max_retries:
-                            wait_time = _get_retry_after(response)
-                            await asyncio.sleep(wait_time)
-                            retries += 1
-                            continue
-                    _handle_error_response(response)
-                break
+        if batch:
+            response = await self._get_page(method, page_url, page, **kwargs)
+            items = _parse_json(response)
+            for item in items:
+                yield item
+            last_page = _get_last_page(response)
+            if last_page is not None:
+                pages = iter(range(2, last_page + 1))
+                # A sliding window: at most page_concurrency pages are in
+                # flight or waiting to be read, however slow the consumer
+                window = deque(
+                    asyncio.ensure_future(self._get_page(method, page_url, page, **kwargs))
+                    for page in islice(pages, self._page_concurrency)
+                )
+                try:
+                    while window:
+                        response = await window.popleft()
+                        for page in islice(pages, 1):
+                            window.append(
+                                asyncio.ensure_future(
+                                    self._get_page(method, page_url, page, **kwargs)
+                                )
+                            )
+                        for item in _parse_json(response):
+                            yield item
+                finally:
+                    for task in window:
+                        task.cancel()
+                return
+            if not items or (response.links and "next" not in response.links):
+                return
+            # No last page advertised; continue sequentially
+            page = 2
 
-            items = response.json()
+        while True:
+            response = await self._get_page(method, page_url, page, **kwargs)
+            items = _parse_json(response)
             if not items:
                 break
 
             for item in items:
                 yield item
+            # A Link header without rel="next" marks the last page
+            if response.links and "next" not in response.links:
+                break
             page += 1
 
     def repo(self, owner: str, name: str | None = None) -> AsyncRepo:
@@ -451,7 +839,12 @@ class AsyncGitHub:
             if "/" not in owner:
                 raise ValueError("Must provide repo name or use 'owner/repo' format")
             owner, name = owner.split("/", 1)
-        return AsyncRepo(self, owner, name)
+        # Repeat calls for a repo still in use return the same object
+        full_name = f"{owner}/{name}"
+        repo = self._repos.get(full_name)
+        if repo is None:
+            repo = self._repos[full_name] = AsyncRepo(self, owner, name)
+        return repo
 
     async def rate_limit(self) -> dict[str, Any]:
         """Get current rate limit status.
@@ -461,9 +854,26 @@ class AsyncGitHub:
         """
         return await self.request("GET", "/rate_limit")
 
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """HTTP client, built on first use so unused clients cost nothing."""
+        # No lock needed: this never awaits, so it runs atomically on the loop
+        client = self._http_client
+        if client is None or self._closed:
+            if self._closed:
+                raise RuntimeError("Cannot send a request, as the client has been closed.")
+            http2 = self._client_kwargs["http2"]
+            client = self._http_client = httpx.AsyncClient(
+                **self._client_kwargs, limits=_LIMITS, verify=_get_ssl_context(http2)
+            )
+        return client
+
     async def close(self) -> None:
         """Close the HTTP client."""
-        await self._client.aclose()
+        self._closed = True
+        # Closing the httpx client would close a transport we were given
+        if self._owns_transport and self._http_client is not None:
+            await self._http_client.aclose()
 
     async def __aenter__(self) -> AsyncGitHub:
         return self
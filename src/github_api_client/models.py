@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import sys
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -10,23 +12,52 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from github_api_client.repo import Repo
 
+# datetime.fromisoformat accepts a "Z" suffix from Python 3.11
+_ISO_Z_SUPPORTED = sys.version_info >= (3, 11)
+# Timestamps repeat heavily across listed items, so parsed values are reused
+_DATETIME_CACHE_SIZE = 4096
+_datetime_cache: dict[str, datetime] = {}
+# Set GITHUB_API_KEEP_RAW=1 to keep each response dict on its model as _raw
+_KEEP_RAW = os.environ.get("GITHUB_API_KEEP_RAW") == "1"
+
 
 def _parse_datetime(value: str | None) -> datetime | None:
     """Parse ISO 8601 datetime string to datetime object."""
     if value is None:
         return None
-    # GitHub uses ISO 8601 format: 2024-01-15T10:30:00Z
-    return datetime.fromisoformat(value.replace("Z", "+00:00"))
-
-
-def _parse_user(data: dict[str, Any] | None) -> User | None:
-    """Parse user data into User object."""
+    parsed = _datetime_cache.get(value)
+    if parsed is None:
+        # GitHub uses ISO 8601 format: 2024-01-15T10:30:00Z
+        text = value if _ISO_Z_SUPPORTED else value.replace("Z", "+00:00")
+        parsed = datetime.fromisoformat(text)
+        if len(_datetime_cache) >= _DATETIME_CACHE_SIZE:
+            _datetime_cache.clear()
+        _datetime_cache[value] = parsed
+    return parsed
+
+
+def _parse_user(
+    data: dict[str, Any] | None,
+    keep_raw: bool = _KEEP_RAW,
+    users: dict[int, User] | None = None,
+) -> User | None:
+    """Parse user data into User object, reusing any already in users (by id)."""
     if data is None:
         return None
-    return User.from_dict(data)
+    if users is None:
+        return User.from_dict(data, keep_raw=keep_raw)
+    return _pooled_user(data, users, keep_raw)
+
 
+def _pooled_user(data: dict[str, Any], users: dict[int, User], keep_raw: bool) -> User:
+    """Return the User for data from users, parsing and adding it if new."""
+    user = users.get(data["id"])
+    if user is None:
+        user = users[data["id"]] = User.from_dict(data, keep_raw=keep_raw)
+    return user
 
-@dataclass
+
+@dataclass(slots=True)
 class User:
     """A GitHub user."""
 
@@ -52,32 +83,35 @@ class User:
     _raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> User:
+    def from_dict(cls, data: dict[str, Any], *, keep_raw: bool = _KEEP_RAW) -> User:
         """Create User from API response dict."""
+        # Users are nested in most other models, so arguments are passed in
+        # field order: binding them by keyword doubles the construction cost.
+        get = data.get
         return cls(
-            login=data["login"],
-            id=data["id"],
-            avatar_url=data.get("avatar_url", ""),
-            html_url=data.get("html_url", ""),
-            type=data.get("type", "User"),
-            name=data.get("name"),
-            email=data.get("email"),
-            bio=data.get("bio"),
-            company=data.get("company"),
-            location=data.get("location"),
-            blog=data.get("blog"),
-            twitter_username=data.get("twitter_username"),
-            public_repos=data.get("public_repos"),
-            public_gists=data.get("public_gists"),
-            followers=data.get("followers"),
-            following=data.get("following"),
-            created_at=_parse_datetime(data.get("created_at")),
-            updated_at=_parse_datetime(data.get("updated_at")),
-            _raw=data,
+            data["login"],
+            data["id"],
+            get("avatar_url", ""),
+            get("html_url", ""),
+            get("type", "User"),
+            get("name"),
+            get("email"),
+            get("bio"),
+            get("company"),
+            get("location"),
+            get("blog"),
+            get("twitter_username"),
+            get("public_repos"),
+            get("public_gists"),
+            get("followers"),
+            get("following"),
+            _parse_datetime(get("created_at")),
+            _parse_datetime(get("updated_at")),
+            data if keep_raw else {},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Label:
     """A GitHub label."""
 
@@ -90,19 +124,21 @@ class Label:
     _raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Label:
+    def from_dict(cls, data: dict[str, Any], *, keep_raw: bool = _KEEP_RAW) -> Label:
         """Create Label from API response dict."""
+        # Passed in field order, as in User.from_dict
+        get = data.get
         return cls(
-            id=data["id"],
-            name=data["name"],
-            color=data.get("color", ""),
-            description=data.get("description"),
-            default=data.get("default", False),
-            _raw=data,
+            data["id"],
+            data["name"],
+            get("color", ""),
+            get("description"),
+            get("default", False),
+            data if keep_raw else {},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Milestone:
     """A GitHub milestone."""
 
@@ -121,7 +157,7 @@ class Milestone:
     _raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Milestone:
+    def from_dict(cls, data: dict[str, Any], *, keep_raw: bool = _KEEP_RAW) -> Milestone:
         """Create Milestone from API response dict."""
         return cls(
             id=data["id"],
@@ -135,11 +171,11 @@ class Milestone:
             updated_at=_parse_datetime(data.get("updated_at")),
             due_on=_parse_datetime(data.get("due_on")),
             closed_at=_parse_datetime(data.get("closed_at")),
-            _raw=data,
+            _raw=data if keep_raw else {},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     """A GitHub issue or PR comment."""
 
@@ -154,21 +190,25 @@ class Comment:
     _repo: Repo | None = field(default=None, repr=False)
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any], repo: Repo | None = None) -> Comment:
+    def from_dict(
+        cls, data: dict[str, Any], repo: Repo | None = None, *, keep_raw: bool = _KEEP_RAW
+    ) -> Comment:
         """Create Comment from API response dict."""
+        # Passed in field order, as in User.from_dict
+        get = data.get
         return cls(
-            id=data["id"],
-            body=data.get("body", ""),
-            user=_parse_user(data.get("user")),
-            html_url=data.get("html_url", ""),
-            created_at=_parse_datetime(data.get("created_at")),
-            updated_at=_parse_datetime(data.get("updated_at")),
-            _raw=data,
-            _repo=repo,
+            data["id"],
+            get("body", ""),
+            _parse_user(get("user"), keep_raw),
+            get("html_url", ""),
+            _parse_datetime(get("created_at")),
+            _parse_datetime(get("updated_at")),
+            data if keep_raw else {},
+            repo,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """A GitHub issue with convenience methods."""
 
@@ -194,34 +234,42 @@ class Issue:
     _repo: Repo | None = field(default=None, repr=False)
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any], repo: Repo | None = None) -> Issue:
+    def from_dict(
+        cls, data: dict[str, Any], repo: Repo | None = None, *, keep_raw: bool = _KEEP_RAW
+    ) -> Issue:
         """Create Issue from API response dict."""
-        assignees = [User.from_dict(a) for a in data.get("assignees", [])]
-        labels = [Label.from_dict(label_data) for label_data in data.get("labels", [])]
+        # Passed in field order, as in User.from_dict
+        get = data.get
+        # The author, assignees and closer are often the same person
+        users: dict[int, User] = {}
+        assignees = [_pooled_user(a, users, keep_raw) for a in get("assignees", [])]
+        labels = [
+            Label.from_dict(label_data, keep_raw=keep_raw) for label_data in get("labels", [])
+        ]
         milestone = None
-        if data.get("milestone"):
-            milestone = Milestone.from_dict(data["milestone"])
+        if get("milestone"):
+            milestone = Milestone.from_dict(data["milestone"], keep_raw=keep_raw)
 
         return cls(
-            id=data["id"],
-            number=data["number"],
-            title=data["title"],
-            body=data.get("body"),
-            state=data.get("state", "open"),
-            locked=data.get("locked", False),
-            user=_parse_user(data.get("user")),
-            assignee=_parse_user(data.get("assignee")),
-            assignees=assignees,
-            labels=labels,
-            milestone=milestone,
-            html_url=data.get("html_url", ""),
-            comments=data.get("comments", 0),
-            created_at=_parse_datetime(data.get("created_at")),
-            updated_at=_parse_datetime(data.get("updated_at")),
-            closed_at=_parse_datetime(data.get("closed_at")),
-            closed_by=_parse_user(data.get("closed_by")),
-            _raw=data,
-            _repo=repo,
+            data["id"],
+            data["number"],
+            data["title"],
+            get("body"),
+            get("state", "open"),
+            get("locked", False),
+            _parse_user(get("user"), keep_raw, users),
+            _parse_user(get("assignee"), keep_raw, users),
+            assignees,
+            labels,
+            milestone,
+            get("html_url", ""),
+            get("comments", 0),
+            _parse_datetime(get("created_at")),
+            _parse_datetime(get("updated_at")),
+            _parse_datetime(get("closed_at")),
+            _parse_user(get("closed_by"), keep_raw, users),
+            data if keep_raw else {},
+            repo,
         )
 
     def close(self) -> Issue:
@@ -300,7 +348,7 @@ class Issue:
         return self.state == "closed"
 
 
-@dataclass
+@dataclass(slots=True)
 class PullRequest:
     """A GitHub pull request with convenience methods."""
 
@@ -338,49 +386,57 @@ class PullRequest:
     _repo: Repo | None = field(default=None, repr=False)
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any], repo: Repo | None = None) -> PullRequest:
+    def from_dict(
+        cls, data: dict[str, Any], repo: Repo | None = None, *, keep_raw: bool = _KEEP_RAW
+    ) -> PullRequest:
         """Create PullRequest from API response dict."""
-        assignees = [User.from_dict(a) for a in data.get("assignees", [])]
-        labels = [Label.from_dict(label_data) for label_data in data.get("labels", [])]
+        # Passed in field order, as in User.from_dict
+        get = data.get
+        # The author, assignees and closer are often the same person
+        users: dict[int, User] = {}
+        assignees = [_pooled_user(a, users, keep_raw) for a in get("assignees", [])]
+        labels = [
+            Label.from_dict(label_data, keep_raw=keep_raw) for label_data in get("labels", [])
+        ]
         milestone = None
-        if data.get("milestone"):
-            milestone = Milestone.from_dict(data["milestone"])
+        if get("milestone"):
+            milestone = Milestone.from_dict(data["milestone"], keep_raw=keep_raw)
 
-        head = data.get("head", {})
-        base = data.get("base", {})
+        head = get("head", {})
+        base = get("base", {})
 
         return cls(
-            id=data["id"],
-            number=data["number"],
-            title=data["title"],
-            body=data.get("body"),
-            state=data.get("state", "open"),
-            locked=data.get("locked", False),
-            draft=data.get("draft", False),
-            merged=data.get("merged", False),
-            mergeable=data.get("mergeable"),
-            user=_parse_user(data.get("user")),
-            assignee=_parse_user(data.get("assignee")),
-            assignees=assignees,
-            labels=labels,
-            milestone=milestone,
-            html_url=data.get("html_url", ""),
-            head_ref=head.get("ref", ""),
-            head_sha=head.get("sha", ""),
-            base_ref=base.get("ref", ""),
-            base_sha=base.get("sha", ""),
-            comments=data.get("comments", 0),
-            commits=data.get("commits", 0),
-            additions=data.get("additions", 0),
-            deletions=data.get("deletions", 0),
-            changed_files=data.get("changed_files", 0),
-            created_at=_parse_datetime(data.get("created_at")),
-            updated_at=_parse_datetime(data.get("updated_at")),
-            closed_at=_parse_datetime(data.get("closed_at")),
-            merged_at=_parse_datetime(data.get("merged_at")),
-            merged_by=_parse_user(data.get("merged_by")),
-            _raw=data,
-            _repo=repo,
+            data["id"],
+            data["number"],
+            data["title"],
+            get("body"),
+            get("state", "open"),
+            get("locked", False),
+            get("draft", False),
+            get("merged", False),
+            get("mergeable"),
+            _parse_user(get("user"), keep_raw, users),
+            _parse_user(get("assignee"), keep_raw, users),
+            assignees,
+            labels,
+            milestone,
+            get("html_url", ""),
+            head.get("ref", ""),
+            head.get("sha", ""),
+            base.get("ref", ""),
+            base.get("sha", ""),
+            get("comments", 0),
+            get("commits", 0),
+            get("additions", 0),
+            get("deletions", 0),
+            get("changed_files", 0),
+            _parse_datetime(get("created_at")),
+            _parse_datetime(get("updated_at")),
+            _parse_datetime(get("closed_at")),
+            _parse_datetime(get("merged_at")),
+            _parse_user(get("merged_by"), keep_raw, users),
+            data if keep_raw else {},
+            repo,
         )
 
     def close(self) -> PullRequest:
@@ -502,7 +558,7 @@ class PullRequest:
         return self.merged
 
 
-@dataclass
+@dataclass(slots=True)
 class Repository:
     """A GitHub repository with convenience methods."""
 
@@ -533,33 +589,37 @@ class Repository:
     _client: Any = field(default=None, repr=False)
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any], client: Any = None) -> Repository:
+    def from_dict(
+        cls, data: dict[str, Any], client: Any = None, *, keep_raw: bool = _KEEP_RAW
+    ) -> Repository:
         """Create Repository from API response dict."""
+        # Passed in field order, as in User.from_dict
+        get = data.get
         return cls(
-            id=data["id"],
-            name=data["name"],
-            full_name=data["full_name"],
-            owner=_parse_user(data.get("owner")),
-            private=data.get("private", False),
-            description=data.get("description"),
-            fork=data.get("fork", False),
-            html_url=data.get("html_url", ""),
-            clone_url=data.get("clone_url", ""),
-            ssh_url=data.get("ssh_url", ""),
-            homepage=data.get("homepage"),
-            language=data.get("language"),
-            forks_count=data.get("forks_count", 0),
-            stargazers_count=data.get("stargazers_count", 0),
-            watchers_count=data.get("watchers_count", 0),
-            open_issues_count=data.get("open_issues_count", 0),
-            default_branch=data.get("default_branch", "main"),
-            archived=data.get("archived", False),
-            disabled=data.get("disabled", False),
-            pushed_at=_parse_datetime(data.get("pushed_at")),
-            created_at=_parse_datetime(data.get("created_at")),
-            updated_at=_parse_datetime(data.get("updated_at")),
-            _raw=data,
-            _client=client,
+            data["id"],
+            data["name"],
+            data["full_name"],
+            get("html_url", ""),
+            get("clone_url", ""),
+            get("ssh_url", ""),
+            get("forks_count", 0),
+            get("stargazers_count", 0),
+            get("watchers_count", 0),
+            get("open_issues_count", 0),
+            get("default_branch", "main"),
+            get("private", False),
+            get("fork", False),
+            get("archived", False),
+            get("disabled", False),
+            _parse_user(get("owner"), keep_raw),
+            get("description"),
+            get("homepage"),
+            get("language"),
+            _parse_datetime(get("pushed_at")),
+            _parse_datetime(get("created_at")),
+            _parse_datetime(get("updated_at")),
+            data if keep_raw else {},
+            client,
         )
 
     def star(self) -> None:
@@ -623,7 +683,7 @@ class Repository:
         return self.forks_count
 
 
-@dataclass
+@dataclass(slots=True)
 class Branch:
     """A GitHub branch."""
 
@@ -634,18 +694,20 @@ class Branch:
     _raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Branch:
+    def from_dict(cls, data: dict[str, Any], *, keep_raw: bool = _KEEP_RAW) -> Branch:
         """Create Branch from API response dict."""
-        commit = data.get("commit", {})
+        # Passed in field order, as in User.from_dict
+        get = data.get
+        commit = get("commit", {})
         return cls(
-            name=data["name"],
-            protected=data.get("protected", False),
-            sha=commit.get("sha", ""),
-            _raw=data,
+            data["name"],
+            get("protected", False),
+            commit.get("sha", ""),
+            data if keep_raw else {},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A search result container."""
 
@@ -42,6 +42,7 @@ class RepoIssues:
         mentioned: str | None = None,
         milestone: str | int | None = None,
         since: str | None = None,
+        batch: bool = False,
     ) -> Iterator[Issue]:
         """List issues (excludes pull requests)."""
         for data in self._client.issues.list(
@@ -56,6 +57,7 @@ class RepoIssues:
             mentioned=mentioned,
             milestone=milestone,
             since=since,
+            batch=batch,
         ):
             yield Issue.from_dict(data, self._repo)
 
@@ -147,6 +149,7 @@ class RepoPulls:
         direction: str = "desc",
         head: str | None = None,
         base: str | None = None,
+        batch: bool = False,
     ) -> Iterator[PullRequest]:
         """List pull requests."""
         for data in self._client.pulls.list(
@@ -157,6 +160,7 @@ class RepoPulls:
             direction=direction,
             head=head,
             base=base,
+            batch=batch,
         ):
             yield PullRequest.from_dict(data, self._repo)
 
@@ -268,9 +272,9 @@ class RepoReleases:
         self._repo = repo
         self._client = repo._client
 
-    def list(self) -> Iterator[dict[str, Any]]:
+    def list(self, batch: bool = False) -> Iterator[dict[str, Any]]:
         """List releases."""
-        yield from self._client.releases.list(self._repo.owner, self._repo.name)
+        yield from self._client.releases.list(self._repo.owner, self._repo.name, batch=batch)
 
     def get(self, release_id: int) -> dict[str, Any]:
         """Get a release by ID."""
@@ -401,9 +405,11 @@ class Repo:
         """List repository tags."""
         return self._client.repos.list_tags(self.owner, self.name)
 
-    def branches(self, protected: bool | None = None) -> Iterator[Branch]:
+    def branches(self, protected: bool | None = None, batch: bool = False) -> Iterator[Branch]:
         """List repository branches."""
-        for data in self._client.repos.list_branches(self.owner, self.name, protected=protected):
+        for data in self._client.repos.list_branches(
+            self.owner, self.name, protected=protected, batch=batch
+        ):
             yield Branch.from_dict(data)
 
     # Convenience shortcuts
@@ -482,6 +488,7 @@ class AsyncRepoIssues:
         mentioned: str | None = None,
         milestone: str | int | None = None,
         since: str | None = None,
+        batch: bool = False,
     ) -> AsyncIterator[Issue]:
         """List issues (excludes pull requests)."""
         async for data in self._client.issues.list(
@@ -496,6 +503,7 @@ class AsyncRepoIssues:
             mentioned=mentioned,
             milestone=milestone,
             since=since,
+            batch=batch,
         ):
             yield Issue.from_dict(data, self._repo)
 
@@ -591,6 +599,7 @@ class AsyncRepoPulls:
         direction: str = "desc",
         head: str | None = None,
         base: str | None = None,
+        batch: bool = False,
     ) -> AsyncIterator[PullRequest]:
         """List pull requests."""
         async for data in self._client.pulls.list(
@@ -601,6 +610,7 @@ class AsyncRepoPulls:
             direction=direction,
             head=head,
             base=base,
+            batch=batch,
         ):
             yield PullRequest.from_dict(data, self._repo)
 
@@ -723,9 +733,11 @@ class AsyncRepoReleases:
         self._repo = repo
         self._client = repo._client
 
-    async def list(self) -> AsyncIterator[dict[str, Any]]:
+    async def list(self, batch: bool = False) -> AsyncIterator[dict[str, Any]]:
         """List releases."""
-        async for item in self._client.releases.list(self._repo.owner, self._repo.name):
+        async for item in self._client.releases.list(
+            self._repo.owner, self._repo.name, batch=batch
+        ):
             yield item
 
     async def get(self, release_id: int) -> dict[str, Any]:
@@ -851,10 +863,12 @@ class AsyncRepo:
         async for item in self._client.repos.list_tags(self.owner, self.name):
             yield item
 
-    async def branches(self, protected: bool | None = None) -> AsyncIterator[Branch]:
+    async def branches(
+        self, protected: bool | None = None, batch: bool = False
+    ) -> AsyncIterator[Branch]:
         """List repository branches."""
         async for data in self._client.repos.list_branches(
-            self.owner, self.name, protected=protected
+            self.owner, self.name, protected=protected, batch=batch
         ):
             yield Branch.from_dict(data)
 
@@ -2,33 +2,123 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator, Iterator
 from typing import TYPE_CHECKING, Any
 
+import httpx
+
+from github_api_client.exceptions import (
+    AuthenticationError,
+    GitHubError,
+    NotFoundError,
+    RateLimitError,
+    ValidationError,
+)
+
 if TYPE_CHECKING:
     from github_api_client.client import AsyncGitHub, GitHub
 
+# Optional faster JSON decoding
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _handle_error_response(response: httpx.Response) -> None:
+    """Raise appropriate exception for error responses."""
+    status_code = response.status_code
+    try:
+        data = response.json()
+        message = data.get("message", response.text)
+    except Exception:
+        data = {}
+        message = response.text
+
+    if status_code == 401:
+        raise AuthenticationError(message, status_code, data)
+    elif status_code == 404:
+        raise NotFoundError(message, status_code, data)
+    elif status_code in (403, 429):
+        reset_at = response.headers.get("X-RateLimit-Reset")
+        raise RateLimitError(
+            message,
+            status_code,
+            data,
+            reset_at=int(reset_at) if reset_at else None,
+        )
+    elif status_code == 422:
+        raise ValidationError(message, status_code, data)
+    else:
+        raise GitHubError(message, status_code, data)
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Encode data as JSON bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _loads_json(content: bytes) -> Any:
+    """Decode a JSON body held as bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _page_url(path: str, params: dict[str, Any]) -> str:
+    """Encode the fixed query once, leaving the page number to be appended."""
+    return f"{path}?{httpx.QueryParams(params)}&page="
+
 
 class Resource:
     """Base class for sync API resources."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: GitHub) -> None:
         self._client = client
 
     def _request(self, method: str, path: str, **kwargs: Any) -> Any:
         return self._client.request(method, path, **kwargs)
 
-    def _paginate(self, method: str, path: str, **kwargs: Any) -> Any:
+    def _request_status(self, method: str, path: str, **kwargs: Any) -> int:
+        return self._client.request_status(method, path, **kwargs)
+
+    def _request_cached(self, path: str, **kwargs: Any) -> Any:
+        return self._client.request_cached(path, **kwargs)
+
+    def _paginate(self, method: str, path: str, **kwargs: Any) -> Iterator[Any]:
         return self._client.paginate(method, path, **kwargs)
 
 
 class AsyncResource:
     """Base class for async API resources."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: AsyncGitHub) -> None:
         self._client = client
 
     async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
         return await self._client.request(method, path, **kwargs)
 
-    def _paginate(self, method: str, path: str, **kwargs: Any) -> Any:
+    async def _request_status(self, method: str, path: str, **kwargs: Any) -> int:
+        return await self._client.request_status(method, path, **kwargs)
+
+    async def _request_cached(self, path: str, **kwargs: Any) -> Any:
+        return await self._client.request_cached(path, **kwargs)
+
+    def _paginate(self, method: str, path: str, **kwargs: Any) -> AsyncIterator[Any]:
         return self._client.paginate(method, path, **kwargs)
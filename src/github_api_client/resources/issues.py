@@ -7,10 +7,33 @@ from typing import Any
 
 from github_api_client.resources.base import AsyncResource, Resource
 
+_UPDATABLE_ISSUE_FIELDS = frozenset(
+    {
+        "title",
+        "body",
+        "assignee",
+        "state",
+        "state_reason",
+        "milestone",
+        "labels",
+        "assignees",
+        "type",
+    }
+)
+
+
+def _check_issue_fields(fields: dict[str, Any]) -> None:
+    """Raise TypeError for fields the update-issue endpoint doesn't accept."""
+    unknown = fields.keys() - _UPDATABLE_ISSUE_FIELDS
+    if unknown:
+        raise TypeError(f"Unknown issue field(s): {', '.join(sorted(unknown))}")
+
 
 class IssuesResource(Resource):
     """Synchronous issue operations."""
 
+    __slots__ = ()
+
     def get(self, owner: str, repo: str, issue_number: int) -> dict[str, Any]:
         """Get an issue.
 
@@ -22,7 +45,7 @@ class IssuesResource(Resource):
         Returns:
             Issue data.
         """
-        return self._request("GET", f"/repos/{owner}/{repo}/issues/{issue_number}")
+        return self._request_cached(f"/repos/{owner}/{repo}/issues/{issue_number}")
 
     def list(
         self,
@@ -37,6 +60,7 @@ class IssuesResource(Resource):
         mentioned: str | None = None,
         milestone: str | int | None = None,
         since: str | None = None,
+        batch: bool = False,
     ) -> Iterator[dict[str, Any]]:
         """List issues for a repository (excludes pull requests).
 
@@ -52,6 +76,8 @@ class IssuesResource(Resource):
             mentioned: Filter by mentioned username.
             milestone: Filter by milestone number or "*" / "none".
             since: Only issues updated after this time (ISO 8601 format).
+            batch: Fetch the remaining pages concurrently once the first
+                page's Link header reveals the last page.
 
         Yields:
             Issue data dictionaries (pull requests are excluded).
@@ -73,7 +99,9 @@ class IssuesResource(Resource):
             params["milestone"] = milestone
         if since:
             params["since"] = since
-        for item in self._paginate("GET", f"/repos/{owner}/{repo}/issues", params=params):
+        for item in self._paginate(
+            "GET", f"/repos/{owner}/{repo}/issues", params=params, batch=batch
+        ):
             if "pull_request" not in item:
                 yield item
 
@@ -128,8 +156,15 @@ class IssuesResource(Resource):
             **kwargs: Fields to update (title, body, state, labels, etc.).
 
         Returns:
-            Updated issue data.
+            Updated issue data. If no fields are given, the issue is fetched
+            instead of sending an empty update.
+
+        Raises:
+            TypeError: If a field is not accepted by the API.
         """
+        _check_issue_fields(kwargs)
+        if not kwargs:
+            return self.get(owner, repo, issue_number)
         return self._request("PATCH", f"/repos/{owner}/{repo}/issues/{issue_number}", json=kwargs)
 
     def close(self, owner: str, repo: str, issue_number: int) -> dict[str, Any]:
@@ -293,9 +328,11 @@ class IssuesResource(Resource):
 class AsyncIssuesResource(AsyncResource):
     """Asynchronous issue operations."""
 
+    __slots__ = ()
+
     async def get(self, owner: str, repo: str, issue_number: int) -> dict[str, Any]:
         """Get an issue."""
-        return await self._request("GET", f"/repos/{owner}/{repo}/issues/{issue_number}")
+        return await self._request_cached(f"/repos/{owner}/{repo}/issues/{issue_number}")
 
     async def list(
         self,
@@ -310,6 +347,7 @@ class AsyncIssuesResource(AsyncResource):
         mentioned: str | None = None,
         milestone: str | int | None = None,
         since: str | None = None,
+        batch: bool = False,
     ) -> AsyncIterator[dict[str, Any]]:
         """List issues for a repository (excludes pull requests)."""
         params: dict[str, Any] = {
@@ -329,7 +367,9 @@ class AsyncIssuesResource(AsyncResource):
             params["milestone"] = milestone
         if since:
             params["since"] = since
-        async for item in self._paginate("GET", f"/repos/{owner}/{repo}/issues", params=params):
+        async for item in self._paginate(
+            "GET", f"/repos/{owner}/{repo}/issues", params=params, batch=batch
+        ):
             if "pull_request" not in item:
                 yield item
 
@@ -363,6 +403,9 @@ class AsyncIssuesResource(AsyncResource):
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Update an issue."""
+        _check_issue_fields(kwargs)
+        if not kwargs:
+            return await self.get(owner, repo, issue_number)
         return await self._request(
             "PATCH", f"/repos/{owner}/{repo}/issues/{issue_number}", json=kwargs
         )
@@ -392,17 +435,14 @@ class AsyncIssuesResource(AsyncResource):
         """Unlock an issue."""
         await self._request("DELETE", f"/repos/{owner}/{repo}/issues/{issue_number}/lock")
 
-    async def list_comments(
+    def list_comments(
         self,
         owner: str,
         repo: str,
         issue_number: int,
     ) -> AsyncIterator[dict[str, Any]]:
         """List comments on an issue."""
-        async for item in self._paginate(
-            "GET", f"/repos/{owner}/{repo}/issues/{issue_number}/comments"
-        ):
-            yield item
+        return self._paginate("GET", f"/repos/{owner}/{repo}/issues/{issue_number}/comments")
 
     async def create_comment(
         self,
@@ -418,17 +458,14 @@ class AsyncIssuesResource(AsyncResource):
             json={"body": body},
         )
 
-    async def list_labels(
+    def list_labels(
         self,
         owner: str,
         repo: str,
         issue_number: int,
     ) -> AsyncIterator[dict[str, Any]]:
         """List labels on an issue."""
-        async for item in self._paginate(
-            "GET", f"/repos/{owner}/{repo}/issues/{issue_number}/labels"
-        ):
-            yield item
+        return self._paginate("GET", f"/repos/{owner}/{repo}/issues/{issue_number}/labels")
 
     async def add_labels(
         self,
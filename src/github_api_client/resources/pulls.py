@@ -7,10 +7,21 @@ from typing import Any
 
 from github_api_client.resources.base import AsyncResource, Resource
 
+_UPDATABLE_PULL_FIELDS = frozenset({"title", "body", "state", "base", "maintainer_can_modify"})
+
+
+def _check_pull_fields(fields: dict[str, Any]) -> None:
+    """Raise TypeError for fields the update-pull-request endpoint doesn't accept."""
+    unknown = fields.keys() - _UPDATABLE_PULL_FIELDS
+    if unknown:
+        raise TypeError(f"Unknown pull request field(s): {', '.join(sorted(unknown))}")
+
 
 class PullsResource(Resource):
     """Synchronous pull request operations."""
 
+    __slots__ = ()
+
     def get(self, owner: str, repo: str, pull_number: int) -> dict[str, Any]:
         """Get a pull request.
 
@@ -22,7 +33,7 @@ class PullsResource(Resource):
         Returns:
             Pull request data.
         """
-        return self._request("GET", f"/repos/{owner}/{repo}/pulls/{pull_number}")
+        return self._request_cached(f"/repos/{owner}/{repo}/pulls/{pull_number}")
 
     def list(
         self,
@@ -33,6 +44,7 @@ class PullsResource(Resource):
         direction: str = "desc",
         head: str | None = None,
         base: str | None = None,
+        batch: bool = False,
     ) -> Iterator[dict[str, Any]]:
         """List pull requests for a repository.
 
@@ -44,6 +56,8 @@ class PullsResource(Resource):
             direction: Sort direction (asc, desc).
             head: Filter by head user/org and branch (format: "user:branch").
             base: Filter by base branch name.
+            batch: Fetch the remaining pages concurrently once the first
+                page's Link header reveals the last page.
 
         Yields:
             Pull request data dictionaries.
@@ -57,7 +71,7 @@ class PullsResource(Resource):
             params["head"] = head
         if base:
             params["base"] = base
-        yield from self._paginate("GET", f"/repos/{owner}/{repo}/pulls", params=params)
+        yield from self._paginate("GET", f"/repos/{owner}/{repo}/pulls", params=params, batch=batch)
 
     def create(
         self,
@@ -109,11 +123,18 @@ class PullsResource(Resource):
             owner: Repository owner.
             repo: Repository name.
             pull_number: Pull request number.
-            **kwargs: Fields to update (title, body, state, base).
+            **kwargs: Fields to update (title, body, state, base, maintainer_can_modify).
 
         Returns:
-            Updated pull request data.
+            Updated pull request data. If no fields are given, the pull request
+            is fetched instead of sending an empty update.
+
+        Raises:
+            TypeError: If a field is not accepted by the API.
         """
+        _check_pull_fields(kwargs)
+        if not kwargs:
+            return self.get(owner, repo, pull_number)
         return self._request("PATCH", f"/repos/{owner}/{repo}/pulls/{pull_number}", json=kwargs)
 
     def close(self, owner: str, repo: str, pull_number: int) -> dict[str, Any]:
@@ -172,12 +193,12 @@ class PullsResource(Resource):
 
         Returns:
             True if merged, False otherwise.
+
+        Raises:
+            GitHubError: On API errors other than 404.
         """
-        try:
-            self._request("GET", f"/repos/{owner}/{repo}/pulls/{pull_number}/merge")
-            return True
-        except Exception:
-            return False
+        status = self._request_status("HEAD", f"/repos/{owner}/{repo}/pulls/{pull_number}/merge")
+        return status == 204
 
     def list_commits(
         self,
@@ -299,11 +320,13 @@ class PullsResource(Resource):
 class AsyncPullsResource(AsyncResource):
     """Asynchronous pull request operations."""
 
+    __slots__ = ()
+
     async def get(self, owner: str, repo: str, pull_number: int) -> dict[str, Any]:
         """Get a pull request."""
-        return await self._request("GET", f"/repos/{owner}/{repo}/pulls/{pull_number}")
+        return await self._request_cached(f"/repos/{owner}/{repo}/pulls/{pull_number}")
 
-    async def list(
+    def list(
         self,
         owner: str,
         repo: str,
@@ -312,6 +335,7 @@ class AsyncPullsResource(AsyncResource):
         direction: str = "desc",
         head: str | None = None,
         base: str | None = None,
+        batch: bool = False,
     ) -> AsyncIterator[dict[str, Any]]:
         """List pull requests for a repository."""
         params: dict[str, Any] = {
@@ -323,8 +347,7 @@ class AsyncPullsResource(AsyncResource):
             params["head"] = head
         if base:
             params["base"] = base
-        async for item in self._paginate("GET", f"/repos/{owner}/{repo}/pulls", params=params):
-            yield item
+        return self._paginate("GET", f"/repos/{owner}/{repo}/pulls", params=params, batch=batch)
 
     async def create(
         self,
@@ -357,6 +380,9 @@ class AsyncPullsResource(AsyncResource):
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Update a pull request."""
+        _check_pull_fields(kwargs)
+        if not kwargs:
+            return await self.get(owner, repo, pull_number)
         return await self._request(
             "PATCH", f"/repos/{owner}/{repo}/pulls/{pull_number}", json=kwargs
         )
@@ -388,46 +414,38 @@ class AsyncPullsResource(AsyncResource):
         )
 
     async def is_merged(self, owner: str, repo: str, pull_number: int) -> bool:
-        """Check if a pull request has been merged."""
-        try:
-            await self._request("GET", f"/repos/{owner}/{repo}/pulls/{pull_number}/merge")
-            return True
-        except Exception:
-            return False
-
-    async def list_commits(
+        """Check if a pull request has been merged (raises on errors other than 404)."""
+        status = await self._request_status(
+            "HEAD", f"/repos/{owner}/{repo}/pulls/{pull_number}/merge"
+        )
+        return status == 204
+
+    def list_commits(
         self,
         owner: str,
         repo: str,
         pull_number: int,
     ) -> AsyncIterator[dict[str, Any]]:
         """List commits on a pull request."""
-        async for item in self._paginate(
-            "GET", f"/repos/{owner}/{repo}/pulls/{pull_number}/commits"
-        ):
-            yield item
+        return self._paginate("GET", f"/repos/{owner}/{repo}/pulls/{pull_number}/commits")
 
-    async def list_files(
+    def list_files(
         self,
         owner: str,
         repo: str,
         pull_number: int,
     ) -> AsyncIterator[dict[str, Any]]:
         """List files changed in a pull request."""
-        async for item in self._paginate("GET", f"/repos/{owner}/{repo}/pulls/{pull_number}/files"):
-            yield item
+        return self._paginate("GET", f"/repos/{owner}/{repo}/pulls/{pull_number}/files")
 
-    async def list_reviews(
+    def list_reviews(
         self,
         owner: str,
         repo: str,
         pull_number: int,
     ) -> AsyncIterator[dict[str, Any]]:
         """List reviews on a pull request."""
-        async for item in self._paginate(
-            "GET", f"/repos/{owner}/{repo}/pulls/{pull_number}/reviews"
-        ):
-            yield item
+        return self._paginate("GET", f"/repos/{owner}/{repo}/pulls/{pull_number}/reviews")
 
     async def create_review(
         self,
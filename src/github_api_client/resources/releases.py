@@ -2,27 +2,45 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-from github_api_client.resources.base import AsyncResource, Resource
+from github_api_client.resources.base import (
+    AsyncResource,
+    Resource,
+    _handle_error_response,
+    _parse_json,
+)
+
+_UPLOAD_CHUNK_SIZE = 1 << 20  # Bytes read per step when streaming an async upload
+
+
+async def _aiter_file(f: BinaryIO) -> AsyncIterator[bytes]:
+    """Read an open file in chunks without blocking the event loop."""
+    while chunk := await asyncio.to_thread(f.read, _UPLOAD_CHUNK_SIZE):
+        yield chunk
 
 
 class ReleasesResource(Resource):
     """Synchronous release operations."""
 
-    def list(self, owner: str, repo: str) -> Iterator[dict[str, Any]]:
+    __slots__ = ()
+
+    def list(self, owner: str, repo: str, batch: bool = False) -> Iterator[dict[str, Any]]:
         """List releases for a repository.
 
         Args:
             owner: Repository owner.
             repo: Repository name.
+            batch: Fetch the remaining pages concurrently once the first
+                page's Link header reveals the last page.
 
         Yields:
             Release data dictionaries.
         """
-        yield from self._paginate("GET", f"/repos/{owner}/{repo}/releases")
+        yield from self._paginate("GET", f"/repos/{owner}/{repo}/releases", batch=batch)
 
     def get(self, owner: str, repo: str, release_id: int) -> dict[str, Any]:
         """Get a release by ID.
@@ -35,7 +53,7 @@ class ReleasesResource(Resource):
         Returns:
             Release data.
         """
-        return self._request("GET", f"/repos/{owner}/{repo}/releases/{release_id}")
+        return self._request_cached(f"/repos/{owner}/{repo}/releases/{release_id}")
 
     def get_latest(self, owner: str, repo: str) -> dict[str, Any]:
         """Get the latest release.
@@ -47,7 +65,7 @@ class ReleasesResource(Resource):
         Returns:
             Latest release data.
         """
-        return self._request("GET", f"/repos/{owner}/{repo}/releases/latest")
+        return self._request_cached(f"/repos/{owner}/{repo}/releases/latest")
 
     def get_by_tag(self, owner: str, repo: str, tag: str) -> dict[str, Any]:
         """Get a release by tag name.
@@ -186,25 +204,22 @@ class ReleasesResource(Resource):
         path = Path(file_path)
         asset_name = name or path.name
 
-        with open(path, "rb") as f:
-            content = f.read()
-
         # Upload URL uses uploads.github.com instead of api.github.com
         upload_url = f"https://uploads.github.com/repos/{owner}/{repo}/releases/{release_id}/assets"
 
-        response = self._client._client.post(
-            upload_url,
-            params={"name": asset_name},
-            content=content,
-            headers={"Content-Type": content_type},
-        )
+        # Streamed from the file, so large assets aren't read into memory
+        with open(path, "rb") as f:
+            response = self._client._client.post(
+                upload_url,
+                params={"name": asset_name},
+                content=f,
+                headers={"Content-Type": content_type, "Content-Length": str(path.stat().st_size)},
+            )
 
         if response.status_code >= 400:
-            from github_api_client.client import _handle_error_response
-
             _handle_error_response(response)
 
-        return response.json()
+        return _parse_json(response)
 
     def delete_asset(self, owner: str, repo: str, asset_id: int) -> None:
         """Delete a release asset.
@@ -220,18 +235,22 @@ class ReleasesResource(Resource):
 class AsyncReleasesResource(AsyncResource):
     """Asynchronous release operations."""
 
-    async def list(self, owner: str, repo: str) -> AsyncIterator[dict[str, Any]]:
+    __slots__ = ()
+
+    async def list(
+        self, owner: str, repo: str, batch: bool = False
+    ) -> AsyncIterator[dict[str, Any]]:
         """List releases for a repository."""
-        async for item in self._paginate("GET", f"/repos/{owner}/{repo}/releases"):
+        async for item in self._paginate("GET", f"/repos/{owner}/{repo}/releases", batch=batch):
             yield item
 
     async def get(self, owner: str, repo: str, release_id: int) -> dict[str, Any]:
         """Get a release by ID."""
-        return await self._request("GET", f"/repos/{owner}/{repo}/releases/{release_id}")
+        return await self._request_cached(f"/repos/{owner}/{repo}/releases/{release_id}")
 
     async def get_latest(self, owner: str, repo: str) -> dict[str, Any]:
         """Get the latest release."""
-        return await self._request("GET", f"/repos/{owner}/{repo}/releases/latest")
+        return await self._request_cached(f"/repos/{owner}/{repo}/releases/latest")
 
     async def get_by_tag(self, owner: str, repo: str, tag: str) -> dict[str, Any]:
         """Get a release by tag name."""
@@ -307,24 +326,20 @@ class AsyncReleasesResource(AsyncResource):
         path = Path(file_path)
         asset_name = name or path.name
 
-        with open(path, "rb") as f:
-            content = f.read()
-
         upload_url = f"https://uploads.github.com/repos/{owner}/{repo}/releases/{release_id}/assets"
 
-        response = await self._client._client.post(
-            upload_url,
-            params={"name": asset_name},
-            content=content,
-            headers={"Content-Type": content_type},
-        )
+        with open(path, "rb") as f:
+            response = await self._client._client.post(
+                upload_url,
+                params={"name": asset_name},
+                content=_aiter_file(f),
+                headers={"Content-Type": content_type, "Content-Length": str(path.stat().st_size)},
+            )
 
         if response.status_code >= 400:
-            from github_api_client.client import _handle_error_response
-
             _handle_error_response(response)
 
-        return response.json()
+        return _parse_json(response)
 
     async def delete_asset(self, owner: str, repo: str, asset_id: int) -> None:
         """Delete a release asset."""
@@ -11,6 +11,8 @@ from github_api_client.resources.base import AsyncResource, Resource
 class ReposResource(Resource):
     """Synchronous repository operations."""
 
+    __slots__ = ()
+
     def get(self, owner: str, repo: str) -> dict[str, Any]:
         """Get a repository.
 
@@ -21,7 +23,7 @@ class ReposResource(Resource):
         Returns:
             Repository data.
         """
-        return self._request("GET", f"/repos/{owner}/{repo}")
+        return self._request_cached(f"/repos/{owner}/{repo}")
 
     def list_for_user(
         self,
@@ -221,6 +223,7 @@ class ReposResource(Resource):
         owner: str,
         repo: str,
         protected: bool | None = None,
+        batch: bool = False,
     ) -> Iterator[dict[str, Any]]:
         """List repository branches.
 
@@ -228,6 +231,8 @@ class ReposResource(Resource):
             owner: Repository owner.
             repo: Repository name.
             protected: Filter by protected status.
+            batch: Fetch the remaining pages concurrently once the first
+                page's Link header reveals the last page.
 
         Yields:
             Branch data dictionaries.
@@ -235,15 +240,19 @@ class ReposResource(Resource):
         params: dict[str, Any] = {}
         if protected is not None:
             params["protected"] = str(protected).lower()
-        yield from self._paginate("GET", f"/repos/{owner}/{repo}/branches", params=params)
+        yield from self._paginate(
+            "GET", f"/repos/{owner}/{repo}/branches", params=params, batch=batch
+        )
 
 
 class AsyncReposResource(AsyncResource):
     """Asynchronous repository operations."""
 
+    __slots__ = ()
+
     async def get(self, owner: str, repo: str) -> dict[str, Any]:
         """Get a repository."""
-        return await self._request("GET", f"/repos/{owner}/{repo}")
+        return await self._request_cached(f"/repos/{owner}/{repo}")
 
     async def list_for_user(
         self,
@@ -359,10 +368,13 @@ class AsyncReposResource(AsyncResource):
         owner: str,
         repo: str,
         protected: bool | None = None,
+        batch: bool = False,
     ) -> AsyncIterator[dict[str, Any]]:
         """List repository branches."""
         params: dict[str, Any] = {}
         if protected is not None:
             params["protected"] = str(protected).lower()
-        async for item in self._paginate("GET", f"/repos/{owner}/{repo}/branches", params=params):
+        async for item in self._paginate(
+            "GET", f"/repos/{owner}/{repo}/branches", params=params, batch=batch
+        ):
             yield item
@@ -2,20 +2,207 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
 from collections.abc import AsyncIterator, Iterator
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from github_api_client.resources.base import (
+    AsyncResource,
+    Resource,
+    _dumps_json,
+    _handle_error_response,
+    _loads_json,
+    _page_url,
+    _parse_json,
+)
+
+if TYPE_CHECKING:
+    from github_api_client.client import AsyncGitHub, GitHub
+
+# Optional incremental JSON decoding for large search responses
+try:
+    import ijson  # type: ignore[import-untyped]
+
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# The search API never returns more than 1000 results for a query
+_SEARCH_RESULT_LIMIT = 1000
+# Cap on concurrent page requests in batch mode (GitHub limits concurrent searches)
+_BATCH_WORKERS = 5
+# Number of distinct queries kept when search result caching is enabled
+_CACHE_SIZE = 256
+# Pages kept for conditional requests; a page holds up to 100 results
+_ETAG_PAGES = 32
+# Pages smaller than this as sent are decoded whole; ijson costs more CPU per
+# item than orjson, which only pays off when the download takes a while
+_STREAM_MIN_BYTES = 32_000
+_SEARCH_ENDPOINTS = frozenset({"issues", "repositories", "code", "users", "commits"})
+
+
+def _last_page(total_count: int, per_page: int) -> int:
+    """Get the number of pages holding total_count results."""
+    return -(-min(total_count, _SEARCH_RESULT_LIMIT) // per_page)
+
+
+def _query_params(query: str, sort: str | None, order: str, per_page: int) -> dict[str, Any]:
+    """Build the query parameters shared by all search endpoints."""
+    params: dict[str, Any] = {"q": query, "order": order}
+    if sort:
+        params["sort"] = sort
+    # The API caps pages at 100 results; batch page counts must match
+    params["per_page"] = max(1, min(per_page, 100))
+    return params
+
+
+def _pages_url(endpoint: str, query: str, sort: str | None, order: str, per_page: int) -> str:
+    """Get the page URL prefix for a whole-page search of endpoint."""
+    if endpoint not in _SEARCH_ENDPOINTS:
+        raise ValueError(f"Unknown search endpoint: {endpoint}")
+    return _page_url(f"/search/{endpoint}", _query_params(query, sort, order, per_page))
+
+
+def _cache_key(path: str, params: dict[str, Any]) -> tuple[Any, ...]:
+    """Build a cache key identifying a search query."""
+    return (path, *sorted(params.items()))
+
+
+def _is_small(response: httpx.Response) -> bool:
+    """Check whether a response is small enough to decode in one go."""
+    length = response.headers.get("Content-Length")
+    return length is not None and int(length) < _STREAM_MIN_BYTES
+
+
+def _store_page(
+    pages: OrderedDict[str, tuple[str, bytes, bool]],
+    url: str,
+    response: httpx.Response,
+    has_next: bool,
+) -> None:
+    """Remember a page of results by URL, to request it again with its ETag.
+
+    The body is kept as bytes and decoded on each reuse, so callers never
+    share (and can't alter each other's) result dicts.
+    """
+    etag = response.headers.get("ETag")
+    if not etag:
+        return
+    # Pop first so the page moves to the end, as the most recently fetched
+    pages.pop(url, None)
+    pages[url] = (etag, response.content, has_next)
+    if len(pages) > _ETAG_PAGES:
+        pages.popitem(last=False)
+
+
+class _SearchCache:
+    """LRU cache of search results that expire after a fixed time.
+
+    Results are held as a JSON array and decoded afresh on every hit, so
+    callers never share (or mutate) the cached items.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = _CACHE_SIZE) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: tuple[Any, ...]) -> list[dict[str, Any]] | None:
+        """Get the cached results for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        items: list[dict[str, Any]] = _loads_json(content)
+        return items
+
+    def set(self, key: tuple[Any, ...], items: list[bytes]) -> None:
+        """Cache the JSON-encoded results for key, evicting the least recently used query."""
+        self._entries[key] = (time.monotonic() + self._ttl, b"[" + b",".join(items) + b"]")
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class _SearchPageParser:
+    """Assemble search result items from ijson parse events."""
+
+    def __init__(self) -> None:
+        self.has_next = False
+        self._builder: Any = None
+
+    def feed(self, prefix: str, event: str, value: Any) -> dict[str, Any] | None:
+        """Feed a parse event, returning an item once it is complete."""
+        if prefix == "items.item" and event == "start_map":
+            self._builder = ijson.ObjectBuilder()
+        if self._builder is None:
+            return None
+
+        self._builder.event(event, value)
+        if prefix == "items.item" and event == "end_map":
+            item: dict[str, Any] = self._builder.value
+            self._builder = None
+            return item
+        return None
+
+
+class _StreamReader:
+    """File-like adapter over a response byte stream for ijson."""
 
-from github_api_client.resources.base import AsyncResource, Resource
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str
+        if size == 0:
+            return b""
+        return next(self._chunks, b"")
+
+
+class _AsyncStreamReader:
+    """Async file-like adapter over a response byte stream for ijson."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
 
 
 class SearchResource(Resource):
     """Synchronous search operations."""
 
+    __slots__ = ("_cache", "_pages", "_pages_lock")
+
+    def __init__(self, client: GitHub) -> None:
+        super().__init__(client)
+        ttl = client._search_cache_ttl
+        self._cache = _SearchCache(ttl) if ttl else None
+        self._pages: OrderedDict[str, tuple[str, bytes, bool]] = OrderedDict()
+        # Batch and prefetch fetch pages from worker threads
+        self._pages_lock = threading.Lock()
+
     def issues(
         self,
         query: str,
         sort: str | None = None,
         order: str = "desc",
+        batch: bool = False,
+        prefetch: bool = False,
+        per_page: int = 100,
     ) -> Iterator[dict[str, Any]]:
         """Search issues and pull requests.
 
@@ -23,6 +210,11 @@ class SearchResource(Resource):
             query: Search query (e.g., "bug label:critical repo:owner/repo").
             sort: Sort field (comments, reactions, created, updated).
             order: Sort order (asc, desc).
+            batch: Fetch the remaining pages concurrently once the first page
+                reports the total count.
+            prefetch: Request the next page in the background while the
+                current page is being consumed.
+            per_page: Results per page (max 100).
 
         Yields:
             Issue/PR data dictionaries.
@@ -32,16 +224,16 @@ class SearchResource(Resource):
             - "is:issue is:open repo:owner/repo" - open issues in a repo
             - "is:pr is:merged author:username" - merged PRs by user
         """
-        params: dict[str, Any] = {"q": query, "order": order}
-        if sort:
-            params["sort"] = sort
-        yield from self._paginate("GET", "/search/issues", params=params)
+        return self._search("/search/issues", query, sort, order, batch, prefetch, per_page)
 
     def repositories(
         self,
         query: str,
         sort: str | None = None,
         order: str = "desc",
+        batch: bool = False,
+        prefetch: bool = False,
+        per_page: int = 100,
     ) -> Iterator[dict[str, Any]]:
         """Search repositories.
 
@@ -49,6 +241,11 @@ class SearchResource(Resource):
             query: Search query (e.g., "machine learning stars:>1000").
             sort: Sort field (stars, forks, help-wanted-issues, updated).
             order: Sort order (asc, desc).
+            batch: Fetch the remaining pages concurrently once the first page
+                reports the total count.
+            prefetch: Request the next page in the background while the
+                current page is being consumed.
+            per_page: Results per page (max 100).
 
         Yields:
             Repository data dictionaries.
@@ -58,16 +255,16 @@ class SearchResource(Resource):
             - "stars:>1000 forks:>100" - popular repos
             - "topic:cli" - repos with cli topic
         """
-        params: dict[str, Any] = {"q": query, "order": order}
-        if sort:
-            params["sort"] = sort
-        yield from self._paginate("GET", "/search/repositories", params=params)
+        return self._search("/search/repositories", query, sort, order, batch, prefetch, per_page)
 
     def code(
         self,
         query: str,
         sort: str | None = None,
         order: str = "desc",
+        batch: bool = False,
+        prefetch: bool = False,
+        per_page: int = 100,
     ) -> Iterator[dict[str, Any]]:
         """Search code.
 
@@ -75,6 +272,11 @@ class SearchResource(Resource):
             query: Search query (e.g., "addClass repo:jquery/jquery").
             sort: Sort field (indexed).
             order: Sort order (asc, desc).
+            batch: Fetch the remaining pages concurrently once the first page
+                reports the total count.
+            prefetch: Request the next page in the background while the
+                current page is being consumed.
+            per_page: Results per page (max 100).
 
         Yields:
             Code search result dictionaries.
@@ -83,16 +285,16 @@ class SearchResource(Resource):
             - "addClass in:file language:js" - code with addClass in JS files
             - "function repo:owner/repo" - functions in specific repo
         """
-        params: dict[str, Any] = {"q": query, "order": order}
-        if sort:
-            params["sort"] = sort
-        yield from self._paginate("GET", "/search/code", params=params)
+        return self._search("/search/code", query, sort, order, batch, prefetch, per_page)
 
     def users(
         self,
         query: str,
         sort: str | None = None,
         order: str = "desc",
+        batch: bool = False,
+        prefetch: bool = False,
+        per_page: int = 100,
     ) -> Iterator[dict[str, Any]]:
         """Search users.
 
@@ -100,6 +302,11 @@ class SearchResource(Resource):
             query: Search query (e.g., "fullname:John location:SF").
             sort: Sort field (followers, repositories, joined).
             order: Sort order (asc, desc).
+            batch: Fetch the remaining pages concurrently once the first page
+                reports the total count.
+            prefetch: Request the next page in the background while the
+                current page is being consumed.
+            per_page: Results per page (max 100).
 
         Yields:
             User data dictionaries.
@@ -108,16 +315,16 @@ class SearchResource(Resource):
             - "type:user location:tokyo" - users in Tokyo
             - "type:org followers:>1000" - orgs with many followers
         """
-        params: dict[str, Any] = {"q": query, "order": order}
-        if sort:
-            params["sort"] = sort
-        yield from self._paginate("GET", "/search/users", params=params)
+        return self._search("/search/users", query, sort, order, batch, prefetch, per_page)
 
     def commits(
         self,
         query: str,
         sort: str | None = None,
         order: str = "desc",
+        batch: bool = False,
+        prefetch: bool = False,
+        per_page: int = 100,
     ) -> Iterator[dict[str, Any]]:
         """Search commits.
 
@@ -125,6 +332,11 @@ class SearchResource(Resource):
             query: Search query.
             sort: Sort field (author-date, committer-date).
             order: Sort order (asc, desc).
+            batch: Fetch the remaining pages concurrently once the first page
+                reports the total count.
+            prefetch: Request the next page in the background while the
+                current page is being consumed.
+            per_page: Results per page (max 100).
 
         Yields:
             Commit data dictionaries.
@@ -133,132 +345,499 @@ class SearchResource(Resource):
             - "fix bug repo:owner/repo" - commits with "fix bug"
             - "author:username" - commits by user
         """
-        params: dict[str, Any] = {"q": query, "order": order}
-        if sort:
-            params["sort"] = sort
-        yield from self._paginate("GET", "/search/commits", params=params)
+        return self._search("/search/commits", query, sort, order, batch, prefetch, per_page)
+
+    def pages(
+        self,
+        endpoint: str,
+        query: str,
+        sort: str | None = None,
+        order: str = "desc",
+        per_page: int = 100,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Search and yield whole pages of results.
 
-    def _paginate(self, method: str, path: str, params: dict[str, Any]) -> Iterator[dict[str, Any]]:
-        """Paginate through search results.
+        For callers that process results in bulk, this yields one list per
+        page instead of one item at a time.
 
-        Search API returns results in a different format than other endpoints.
+        Args:
+            endpoint: Search endpoint (issues, repositories, code, users, commits).
+            query: Search query.
+            sort: Sort field.
+            order: Sort order (asc, desc).
+            per_page: Results per page (max 100).
+
+        Yields:
+            Lists of up to per_page result dictionaries.
+
+        Raises:
+            ValueError: If endpoint is not a search endpoint.
         """
-        params["per_page"] = 100
+        page_url = _pages_url(endpoint, query, sort, order, per_page)
         page = 1
-
         while True:
-            params["page"] = page
-            response = self._client._client.request(method, path, params=params)
-            if response.status_code >= 400:
-                from github_api_client.client import _handle_error_response
+            data, has_next = self._fetch_page("GET", page_url, page)
+            yield data.get("items", [])
+            if not has_next:
+                break
+            page += 1
 
-                _handle_error_response(response)
+    def _search(
+        self,
+        path: str,
+        query: str,
+        sort: str | None,
+        order: str,
+        batch: bool,
+        prefetch: bool,
+        per_page: int,
+    ) -> Iterator[dict[str, Any]]:
+        """Build the query parameters for a search endpoint and paginate it."""
+        params = _query_params(query, sort, order, per_page)
+        return self._paginate("GET", path, params=params, batch=batch, prefetch=prefetch)
 
-            data = response.json()
-            items = data.get("items", [])
-            if not items:
-                break
+    def _paginate(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any],
+        batch: bool = False,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Paginate through search results, reusing cached results if enabled."""
+        if self._cache is None:
+            return self._fetch_results(method, path, params, batch, prefetch)
+        return self._cached_results(self._cache, method, path, params, batch, prefetch)
+
+    def _cached_results(
+        self,
+        cache: _SearchCache,
+        method: str,
+        path: str,
+        params: dict[str, Any],
+        batch: bool,
+        prefetch: bool,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield cached search results, caching them once every page has been read."""
+        key = _cache_key(path, params)
+        cached = cache.get(key)
+        if cached is not None:
+            yield from cached
+            return
+
+        items = []
+        for item in self._fetch_results(method, path, params, batch, prefetch):
+            # Encode before yielding, so the consumer's changes aren't cached
+            items.append(_dumps_json(item))
+            yield item
+        cache.set(key, items)
+
+    def _fetch_results(
+        self, method: str, path: str, params: dict[str, Any], batch: bool, prefetch: bool
+    ) -> Iterator[dict[str, Any]]:
+        """Fetch search results page by page.
+
+        Search API returns results in a different format than other endpoints.
+        """
+        per_page = params.setdefault("per_page", 100)
+        page_url = _page_url(path, params)
+        page = 1
 
-            yield from items
+        if batch:
+            data, _ = self._fetch_page(method, page_url, page)
+            yield from data.get("items", [])
+            last_page = _last_page(data.get("total_count", 0), per_page)
+            pages = iter(range(2, last_page + 1))
+            with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as executor:
+                # A sliding window, as in GitHub.paginate: a consumer that stops
+                # early leaves at most _BATCH_WORKERS pages fetched for nothing
+                window = deque(
+                    executor.submit(self._fetch_page, method, page_url, page)
+                    for page in islice(pages, _BATCH_WORKERS)
+                )
+                try:
+                    while window:
+                        data, _ = window.popleft().result()
+                        for page in islice(pages, 1):
+                            window.append(executor.submit(self._fetch_page, method, page_url, page))
+                        yield from data.get("items", [])
+                finally:
+                    for future in window:
+                        future.cancel()
+            return
+
+        if prefetch:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                next_page: Future[tuple[dict[str, Any], bool]] | None = executor.submit(
+                    self._fetch_page, method, page_url, page
+                )
+                try:
+                    while next_page is not None:
+                        data, has_next = next_page.result()
+                        next_page = None
+                        if has_next:
+                            page += 1
+                            next_page = executor.submit(self._fetch_page, method, page_url, page)
+                        yield from data.get("items", [])
+                finally:
+                    if next_page is not None:
+                        next_page.cancel()
+            return
 
-            # Check if we've gotten all results
-            if len(items) < 100 or page * 100 >= data.get("total_count", 0):
+        while True:
+            parser = _SearchPageParser()
+            yield from self._stream_page(method, page_url, page, parser)
+
+            if not parser.has_next:
                 break
             page += 1
 
+    def _stream_page(
+        self,
+        method: str,
+        page_url: str,
+        page: int,
+        parser: _SearchPageParser,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the items of a page of search results as they are decoded.
+
+        With ijson installed, items are parsed straight off the response stream
+        instead of buffering and decoding the whole page first.
+        """
+        if not HAS_IJSON:
+            data, parser.has_next = self._fetch_page(method, page_url, page)
+            yield from data.get("items", [])
+            return
+
+        url = f"{page_url}{page}"
+        cached = self._pages.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = self._client._send(method, url, stream=True, headers=headers)
+        try:
+            if response.status_code == 304 and cached:
+                parser.has_next = cached[2]
+                yield from _loads_json(cached[1]).get("items", [])
+                return
+            if response.status_code >= 400:
+                _handle_error_response(response)
+            parser.has_next = "next" in response.links
+            if _is_small(response):
+                response.read()
+                data = _parse_json(response)
+                with self._pages_lock:
+                    _store_page(self._pages, url, response, parser.has_next)
+                yield from data.get("items", [])
+                return
+            # Streamed pages aren't cached: keeping their items would cost the
+            # memory streaming saves
+            reader = _StreamReader(response.iter_bytes())
+            for prefix, event, value in ijson.parse(reader, use_float=True):
+                item = parser.feed(prefix, event, value)
+                if item is not None:
+                    yield item
+        finally:
+            response.close()
+
+    def _fetch_page(self, method: str, page_url: str, page: int) -> tuple[dict[str, Any], bool]:
+        """Fetch a single page of search results and whether another follows.
+
+        Pages are requested with the ETag of their last fetch, so an unchanged
+        page comes back as 304 Not Modified and is reused without downloading it.
+        """
+        url = f"{page_url}{page}"
+        cached = self._pages.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = self._client._send(method, url, headers=headers)
+        if response.status_code == 304 and cached:
+            return _loads_json(cached[1]), cached[2]
+        if response.status_code >= 400:
+            _handle_error_response(response)
+        has_next = "next" in response.links
+        with self._pages_lock:
+            _store_page(self._pages, url, response, has_next)
+        return _parse_json(response), has_next
+
 
 class AsyncSearchResource(AsyncResource):
     """Asynchronous search operations."""
 
-    async def issues(
+    __slots__ = ("_cache", "_pages", "_inflight")
+
+    def __init__(self, client: AsyncGitHub) -> None:
+        super().__init__(client)
+        ttl = client._search_cache_ttl
+        self._cache = _SearchCache(ttl) if ttl else None
+        self._pages: OrderedDict[str, tuple[str, bytes, bool]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[tuple[bytes, bool]]] = {}
+
+    def issues(
         self,
         query: str,
         sort: str | None = None,
         order: str = "desc",
+        batch: bool = False,
+        prefetch: bool = False,
+        per_page: int = 100,
     ) -> AsyncIterator[dict[str, Any]]:
         """Search issues and pull requests."""
-        params: dict[str, Any] = {"q": query, "order": order}
-        if sort:
-            params["sort"] = sort
-        async for item in self._paginate("GET", "/search/issues", params=params):
-            yield item
+        return self._search("/search/issues", query, sort, order, batch, prefetch, per_page)
 
-    async def repositories(
+    def repositories(
         self,
         query: str,
         sort: str | None = None,
         order: str = "desc",
+        batch: bool = False,
+        prefetch: bool = False,
+        per_page: int = 100,
     ) -> AsyncIterator[dict[str, Any]]:
         """Search repositories."""
-        params: dict[str, Any] = {"q": query, "order": order}
-        if sort:
-            params["sort"] = sort
-        async for item in self._paginate("GET", "/search/repositories", params=params):
-            yield item
+        return self._search("/search/repositories", query, sort, order, batch, prefetch, per_page)
 
-    async def code(
+    def code(
         self,
         query: str,
         sort: str | None = None,
         order: str = "desc",
+        batch: bool = False,
+        prefetch: bool = False,
+        per_page: int = 100,
     ) -> AsyncIterator[dict[str, Any]]:
         """Search code."""
-        params: dict[str, Any] = {"q": query, "order": order}
-        if sort:
-            params["sort"] = sort
-        async for item in self._paginate("GET", "/search/code", params=params):
-            yield item
+        return self._search("/search/code", query, sort, order, batch, prefetch, per_page)
 
-    async def users(
+    def users(
         self,
         query: str,
         sort: str | None = None,
         order: str = "desc",
+        batch: bool = False,
+        prefetch: bool = False,
+        per_page: int = 100,
     ) -> AsyncIterator[dict[str, Any]]:
         """Search users."""
-        params: dict[str, Any] = {"q": query, "order": order}
-        if sort:
-            params["sort"] = sort
-        async for item in self._paginate("GET", "/search/users", params=params):
-            yield item
+        return self._search("/search/users", query, sort, order, batch, prefetch, per_page)
 
-    async def commits(
+    def commits(
         self,
         query: str,
         sort: str | None = None,
         order: str = "desc",
+        batch: bool = False,
+        prefetch: bool = False,
+        per_page: int = 100,
     ) -> AsyncIterator[dict[str, Any]]:
         """Search commits."""
-        params: dict[str, Any] = {"q": query, "order": order}
-        if sort:
-            params["sort"] = sort
-        async for item in self._paginate("GET", "/search/commits", params=params):
+        return self._search("/search/commits", query, sort, order, batch, prefetch, per_page)
+
+    async def pages(
+        self,
+        endpoint: str,
+        query: str,
+        sort: str | None = None,
+        order: str = "desc",
+        per_page: int = 100,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Search and yield whole pages of results asynchronously."""
+        page_url = _pages_url(endpoint, query, sort, order, per_page)
+        page = 1
+        while True:
+            data, has_next = await self._fetch_page("GET", page_url, page)
+            yield data.get("items", [])
+            if not has_next:
+                break
+            page += 1
+
+    def _search(
+        self,
+        path: str,
+        query: str,
+        sort: str | None,
+        order: str,
+        batch: bool,
+        prefetch: bool,
+        per_page: int,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Build the query parameters for a search endpoint and paginate it."""
+        params = _query_params(query, sort, order, per_page)
+        return self._paginate("GET", path, params=params, batch=batch, prefetch=prefetch)
+
+    def _paginate(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any],
+        batch: bool = False,
+        prefetch: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Paginate through search results, reusing cached results if enabled."""
+        if self._cache is None:
+            return self._fetch_results(method, path, params, batch, prefetch)
+        return self._cached_results(self._cache, method, path, params, batch, prefetch)
+
+    async def _cached_results(
+        self,
+        cache: _SearchCache,
+        method: str,
+        path: str,
+        params: dict[str, Any],
+        batch: bool,
+        prefetch: bool,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield cached search results, caching them once every page has been read."""
+        key = _cache_key(path, params)
+        cached = cache.get(key)
+        if cached is not None:
+            for item in cached:
+                yield item
+            return
+
+        items = []
+        async for item in self._fetch_results(method, path, params, batch, prefetch):
+            # Encode before yielding, so the consumer's changes aren't cached
+            items.append(_dumps_json(item))
             yield item
+        cache.set(key, items)
 
-    async def _paginate(
-        self, method: str, path: str, params: dict[str, Any]
+    async def _fetch_results(
+        self, method: str, path: str, params: dict[str, Any], batch: bool, prefetch: bool
     ) -> AsyncIterator[dict[str, Any]]:
-        """Paginate through search results asynchronously."""
-        params["per_page"] = 100
+        """Fetch search results page by page asynchronously."""
+        per_page = params.setdefault("per_page", 100)
+        page_url = _page_url(path, params)
         page = 1
 
-        while True:
-            params["page"] = page
-            response = await self._client._client.request(method, path, params=params)
-            if response.status_code >= 400:
-                from github_api_client.client import _handle_error_response
+        if batch:
+            data, _ = await self._fetch_page(method, page_url, page)
+            for item in data.get("items", []):
+                yield item
+            last_page = _last_page(data.get("total_count", 0), per_page)
+            pages = iter(range(2, last_page + 1))
+            # A sliding window, as in AsyncGitHub.paginate: a consumer that stops
+            # early leaves at most _BATCH_WORKERS pages fetched for nothing
+            window = deque(
+                asyncio.ensure_future(self._fetch_page(method, page_url, page))
+                for page in islice(pages, _BATCH_WORKERS)
+            )
+            try:
+                while window:
+                    data, _ = await window.popleft()
+                    for page in islice(pages, 1):
+                        window.append(
+                            asyncio.ensure_future(self._fetch_page(method, page_url, page))
+                        )
+                    for item in data.get("items", []):
+                        yield item
+            finally:
+                for task in window:
+                    task.cancel()
+            return
+
+        if prefetch:
+            next_task: asyncio.Future[tuple[dict[str, Any], bool]] | None = asyncio.ensure_future(
+                self._fetch_page(method, page_url, page)
+            )
+            try:
+                while next_task is not None:
+                    data, has_next = await next_task
+                    next_task = None
+                    if has_next:
+                        page += 1
+                        next_task = asyncio.ensure_future(self._fetch_page(method, page_url, page))
+                    for item in data.get("items", []):
+                        yield item
+            finally:
+                if next_task is not None:
+                    next_task.cancel()
+            return
 
-                _handle_error_response(response)
+        while True:
+            parser = _SearchPageParser()
+            async for item in self._stream_page(method, page_url, page, parser):
+                yield item
 
-            data = response.json()
-            items = data.get("items", [])
-            if not items:
+            if not parser.has_next:
                 break
+            page += 1
 
-            for item in items:
+    async def _stream_page(
+        self,
+        method: str,
+        page_url: str,
+        page: int,
+        parser: _SearchPageParser,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the items of a page of search results as they are decoded."""
+        if not HAS_IJSON:
+            data, parser.has_next = await self._fetch_page(method, page_url, page)
+            for item in data.get("items", []):
                 yield item
+            return
 
-            # Check if we've gotten all results
-            if len(items) < 100 or page * 100 >= data.get("total_count", 0):
-                break
-            page += 1
+        url = f"{page_url}{page}"
+        if url in self._inflight:
+            # Join the request another search already has in flight for this page
+            data, parser.has_next = await self._fetch_page(method, page_url, page)
+            for item in data.get("items", []):
+                yield item
+            return
+
+        cached = self._pages.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = await self._client._send(method, url, stream=True, headers=headers)
+        try:
+            if response.status_code == 304 and cached:
+                parser.has_next = cached[2]
+                for item in _loads_json(cached[1]).get("items", []):
+                    yield item
+                return
+            if response.status_code >= 400:
+                _handle_error_response(response)
+            parser.has_next = "next" in response.links
+            if _is_small(response):
+                await response.aread()
+                data = _parse_json(response)
+                _store_page(self._pages, url, response, parser.has_next)
+                for item in data.get("items", []):
+                    yield item
+                return
+            # Streamed pages aren't cached: keeping their items would cost the
+            # memory streaming saves
+            reader = _AsyncStreamReader(response.aiter_bytes())
+            async for prefix, event, value in ijson.parse(reader, use_float=True):
+                item = parser.feed(prefix, event, value)
+                if item is not None:
+                    yield item
+        finally:
+            await response.aclose()
+
+    async def _fetch_page(
+        self, method: str, page_url: str, page: int
+    ) -> tuple[dict[str, Any], bool]:
+        """Fetch a single page of search results asynchronously.
+
+        Concurrent fetches of the same page share a single request.
+        """
+        url = f"{page_url}{page}"
+        future = self._inflight.get(url)
+        if future is None:
+            future = asyncio.ensure_future(self._request_page(method, url))
+            self._inflight[url] = future
+            future.add_done_callback(lambda _: self._inflight.pop(url, None))
+        # Shielded so one caller being cancelled doesn't cancel the others; each
+        # decodes its own copy of the shared body
+        content, has_next = await asyncio.shield(future)
+        return _loads_json(content), has_next
+
+    async def _request_page(self, method: str, url: str) -> tuple[bytes, bool]:
+        """Send the conditional request behind _fetch_page, returning the body."""
+        cached = self._pages.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = await self._client._send(method, url, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1], cached[2]
+        if response.status_code >= 400:
+            _handle_error_response(response)
+        has_next = "next" in response.links
+        _store_page(self._pages, url, response, has_next)
+        return response.content, has_next
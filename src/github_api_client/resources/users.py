@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from github_api_client.resources.base import AsyncResource, Resource
 
+_EMAIL_CHUNK_SIZE = 100  # Addresses sent per add/delete request
+_EMAIL_WORKERS = 4  # Concurrent requests when a list spans several chunks
+
+
+def _chunks(emails: list[str]) -> list[list[str]]:
+    """Split emails into request-sized chunks."""
+    return [emails[i : i + _EMAIL_CHUNK_SIZE] for i in range(0, len(emails), _EMAIL_CHUNK_SIZE)]
+
 
 class UsersResource(Resource):
     """Synchronous user operations."""
 
+    __slots__ = ()
+
     def get(self, username: str) -> dict[str, Any]:
         """Get a user by username.
 
@@ -20,7 +32,7 @@ class UsersResource(Resource):
         Returns:
             User data.
         """
-        return self._request("GET", f"/users/{username}")
+        return self._request_cached(f"/users/{username}")
 
     def get_authenticated(self) -> dict[str, Any]:
         """Get the authenticated user.
@@ -28,7 +40,7 @@ class UsersResource(Resource):
         Returns:
             Authenticated user data.
         """
-        return self._request("GET", "/user")
+        return self._request_cached("/user")
 
     def update_authenticated(self, **kwargs: Any) -> dict[str, Any]:
         """Update the authenticated user.
@@ -41,27 +53,41 @@ class UsersResource(Resource):
         """
         return self._request("PATCH", "/user", json=kwargs)
 
-    def list_followers(self, username: str) -> Iterator[dict[str, Any]]:
+    def list_followers(
+        self, username: str, batch: bool = False, per_page: int = 100
+    ) -> Iterator[dict[str, Any]]:
         """List followers of a user.
 
         Args:
             username: The username.
+            batch: Fetch the remaining pages concurrently once the first
+                page's Link header reveals the last page.
+            per_page: Results per page (max 100).
 
         Yields:
             User data dictionaries.
         """
-        yield from self._paginate("GET", f"/users/{username}/followers")
+        yield from self._paginate(
+            "GET", f"/users/{username}/followers", per_page=per_page, batch=batch
+        )
 
-    def list_following(self, username: str) -> Iterator[dict[str, Any]]:
+    def list_following(
+        self, username: str, batch: bool = False, per_page: int = 100
+    ) -> Iterator[dict[str, Any]]:
         """List users that a user is following.
 
         Args:
             username: The username.
+            batch: Fetch the remaining pages concurrently once the first
+                page's Link header reveals the last page.
+            per_page: Results per page (max 100).
 
         Yields:
             User data dictionaries.
         """
-        yield from self._paginate("GET", f"/users/{username}/following")
+        yield from self._paginate(
+            "GET", f"/users/{username}/following", per_page=per_page, batch=batch
+        )
 
     def is_following(self, username: str, target: str) -> bool:
         """Check if a user follows another user.
@@ -72,12 +98,11 @@ class UsersResource(Resource):
 
         Returns:
             True if following, False otherwise.
+
+        Raises:
+            GitHubError: On API errors other than 404.
         """
-        try:
-            self._request("GET", f"/users/{username}/following/{target}")
-            return True
-        except Exception:
-            return False
+        return self._request_status("GET", f"/users/{username}/following/{target}") == 204
 
     def follow(self, username: str) -> None:
         """Follow a user (as authenticated user).
@@ -106,77 +131,118 @@ class UsersResource(Resource):
     def add_emails(self, emails: list[str]) -> list[dict[str, Any]]:
         """Add email addresses to the authenticated user.
 
+        Lists longer than 100 addresses are sent as concurrent requests of
+        up to 100 addresses each. Together they are not atomic: if one request
+        fails its error is raised, but other chunks may already have been
+        added, and the error doesn't say which.
+
         Args:
             emails: List of email addresses to add.
 
         Returns:
             List of added email data dictionaries.
         """
-        return self._request("POST", "/user/emails", json={"emails": emails})
+        chunks = _chunks(emails)
+        if len(chunks) <= 1:
+            return self._request("POST", "/user/emails", json={"emails": emails})
+
+        with ThreadPoolExecutor(max_workers=_EMAIL_WORKERS) as executor:
+            results = executor.map(
+                lambda chunk: self._request("POST", "/user/emails", json={"emails": chunk}),
+                chunks,
+            )
+            return [email for result in results for email in result]
 
     def delete_emails(self, emails: list[str]) -> None:
         """Delete email addresses from the authenticated user.
 
+        Long lists are split into concurrent requests as in add_emails, and
+        are likewise not atomic.
+
         Args:
             emails: List of email addresses to delete.
         """
-        self._request("DELETE", "/user/emails", json={"emails": emails})
-
-    def list_ssh_keys(self, username: str) -> Iterator[dict[str, Any]]:
+        chunks = _chunks(emails)
+        if len(chunks) <= 1:
+            self._request("DELETE", "/user/emails", json={"emails": emails})
+            return
+
+        with ThreadPoolExecutor(max_workers=_EMAIL_WORKERS) as executor:
+            list(
+                executor.map(
+                    lambda chunk: self._request("DELETE", "/user/emails", json={"emails": chunk}),
+                    chunks,
+                )
+            )
+
+    def list_ssh_keys(
+        self, username: str, batch: bool = False, per_page: int = 100
+    ) -> Iterator[dict[str, Any]]:
         """List public SSH keys for a user.
 
         Args:
             username: The username.
+            batch: Fetch the remaining pages concurrently once the first
+                page's Link header reveals the last page.
+            per_page: Results per page (max 100).
 
         Yields:
             SSH key data dictionaries.
         """
-        yield from self._paginate("GET", f"/users/{username}/keys")
+        yield from self._paginate("GET", f"/users/{username}/keys", per_page=per_page, batch=batch)
 
-    def list_gpg_keys(self, username: str) -> Iterator[dict[str, Any]]:
+    def list_gpg_keys(
+        self, username: str, batch: bool = False, per_page: int = 100
+    ) -> Iterator[dict[str, Any]]:
         """List GPG keys for a user.
 
         Args:
             username: The username.
+            batch: Fetch the remaining pages concurrently once the first
+                page's Link header reveals the last page.
+            per_page: Results per page (max 100).
 
         Yields:
             GPG key data dictionaries.
         """
-        yield from self._paginate("GET", f"/users/{username}/gpg_keys")
+        yield from self._paginate(
+            "GET", f"/users/{username}/gpg_keys", per_page=per_page, batch=batch
+        )
 
 
 class AsyncUsersResource(AsyncResource):
     """Asynchronous user operations."""
 
+    __slots__ = ()
+
     async def get(self, username: str) -> dict[str, Any]:
         """Get a user by username."""
-        return await self._request("GET", f"/users/{username}")
+        return await self._request_cached(f"/users/{username}")
 
     async def get_authenticated(self) -> dict[str, Any]:
         """Get the authenticated user."""
-        return await self._request("GET", "/user")
+        return await self._request_cached("/user")
 
     async def update_authenticated(self, **kwargs: Any) -> dict[str, Any]:
         """Update the authenticated user."""
         return await self._request("PATCH", "/user", json=kwargs)
 
-    async def list_followers(self, username: str) -> AsyncIterator[dict[str, Any]]:
+    def list_followers(
+        self, username: str, batch: bool = False, per_page: int = 100
+    ) -> AsyncIterator[dict[str, Any]]:
         """List followers of a user."""
-        async for item in self._paginate("GET", f"/users/{username}/followers"):
-            yield item
+        return self._paginate("GET", f"/users/{username}/followers", per_page=per_page, batch=batch)
 
-    async def list_following(self, username: str) -> AsyncIterator[dict[str, Any]]:
+    def list_following(
+        self, username: str, batch: bool = False, per_page: int = 100
+    ) -> AsyncIterator[dict[str, Any]]:
         """List users that a user is following."""
-        async for item in self._paginate("GET", f"/users/{username}/following"):
-            yield item
+        return self._paginate("GET", f"/users/{username}/following", per_page=per_page, batch=batch)
 
     async def is_following(self, username: str, target: str) -> bool:
         """Check if a user follows another user."""
-        try:
-            await self._request("GET", f"/users/{username}/following/{target}")
-            return True
-        except Exception:
-            return False
+        status = await self._request_status("GET", f"/users/{username}/following/{target}")
+        return status == 204
 
     async def follow(self, username: str) -> None:
         """Follow a user (as authenticated user)."""
@@ -191,19 +257,46 @@ class AsyncUsersResource(AsyncResource):
         return await self._request("GET", "/user/emails")
 
     async def add_emails(self, emails: list[str]) -> list[dict[str, Any]]:
-        """Add email addresses to the authenticated user."""
-        return await self._request("POST", "/user/emails", json={"emails": emails})
+        """Add email addresses to the authenticated user (chunked, not atomic)."""
+        chunks = _chunks(emails)
+        if len(chunks) <= 1:
+            return await self._request("POST", "/user/emails", json={"emails": emails})
+
+        semaphore = asyncio.Semaphore(_EMAIL_WORKERS)
+
+        async def add(chunk: list[str]) -> list[dict[str, Any]]:
+            async with semaphore:
+                added: list[dict[str, Any]] = await self._request(
+                    "POST", "/user/emails", json={"emails": chunk}
+                )
+                return added
+
+        results = await asyncio.gather(*(add(chunk) for chunk in chunks))
+        return [email for result in results for email in result]
 
     async def delete_emails(self, emails: list[str]) -> None:
-        """Delete email addresses from the authenticated user."""
-        await self._request("DELETE", "/user/emails", json={"emails": emails})
+        """Delete email addresses from the authenticated user (chunked, not atomic)."""
+        chunks = _chunks(emails)
+        if len(chunks) <= 1:
+            await self._request("DELETE", "/user/emails", json={"emails": emails})
+            return
+
+        semaphore = asyncio.Semaphore(_EMAIL_WORKERS)
+
+        async def delete(chunk: list[str]) -> None:
+            async with semaphore:
+                await self._request("DELETE", "/user/emails", json={"emails": chunk})
+
+        await asyncio.gather(*(delete(chunk) for chunk in chunks))
 
-    async def list_ssh_keys(self, username: str) -> AsyncIterator[dict[str, Any]]:
+    def list_ssh_keys(
+        self, username: str, batch: bool = False, per_page: int = 100
+    ) -> AsyncIterator[dict[str, Any]]:
         """List public SSH keys for a user."""
-        async for item in self._paginate("GET", f"/users/{username}/keys"):
-            yield item
+        return self._paginate("GET", f"/users/{username}/keys", per_page=per_page, batch=batch)
 
-    async def list_gpg_keys(self, username: str) -> AsyncIterator[dict[str, Any]]:
+    def list_gpg_keys(
+        self, username: str, batch: bool = False, per_page: int = 100
+    ) -> AsyncIterator[dict[str, Any]]:
         """List GPG keys for a user."""
-        async for item in self._paginate("GET", f"/users/{username}/gpg_keys"):
-            yield item
+        return self._paginate("GET", f"/users/{username}/gpg_keys", per_page=per_page, batch=batch)
@@ -1,5 +1,11 @@
 """Tests for the GitHub client."""
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
 import pytest
 from github_api_client import AsyncGitHub, GitHub
 from github_api_client.exceptions import (
@@ -101,6 +107,177 @@ class TestGitHub:
             repos = list(gh.repos.list_for_user("octocat"))
             assert len(repos) == 3
 
+    def test_pagination_reuses_http_client(self, httpx_mock: HTTPXMock):
+        """All pages go through the one keep-alive httpx client."""
+        url = "https://api.github.com/users/octocat/followers?per_page=100"
+        httpx_mock.add_response(url=f"{url}&page=1", json=[{"id": 1}])
+        httpx_mock.add_response(url=f"{url}&page=2", json=[{"id": 2}])
+        httpx_mock.add_response(url=f"{url}&page=3", json=[])
+
+        with patch("httpx.Client", wraps=httpx.Client) as client_cls:
+            with GitHub() as gh:
+                assert len(list(gh.users.list_followers("octocat"))) == 2
+            assert client_cls.call_count == 1
+            assert client_cls.call_args.kwargs["limits"].keepalive_expiry == 30.0
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_client_built_on_first_use(self):
+        """No httpx client is built for a client that never sends a request."""
+        with patch("httpx.Client", wraps=httpx.Client) as client_cls:
+            with GitHub() as gh:
+                gh.repo("octocat/Hello-World")
+            assert client_cls.call_count == 0
+
+    def test_client_built_once_across_threads(self):
+        """Threads racing on first use share a single httpx client."""
+        barrier = threading.Barrier(8)
+
+        def first_use(gh: GitHub) -> httpx.Client:
+            barrier.wait()
+            return gh._client
+
+        with patch("httpx.Client", wraps=httpx.Client) as client_cls:
+            with GitHub() as gh, ThreadPoolExecutor(max_workers=8) as executor:
+                clients = list(executor.map(first_use, [gh] * 8))
+            assert client_cls.call_count == 1
+        assert all(client is clients[0] for client in clients)
+
+    def test_request_after_close_raises(self):
+        """A closed client raises instead of quietly building a new httpx client."""
+        gh = GitHub()
+        gh.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            gh.repos.get("octocat", "Hello-World")
+
+    def test_clients_share_ssl_context(self):
+        """New clients reuse one SSL context instead of reloading CA certs."""
+        with patch("httpx.Client", wraps=httpx.Client) as client_cls:
+            with GitHub() as first, GitHub() as second:
+                first._client, second._client
+            first, second = (call.kwargs["verify"] for call in client_cls.call_args_list)
+            assert first is second
+
+    def test_http2_option(self):
+        """The http2 option is passed through to the httpx client."""
+        # A mock client, as building a real HTTP/2 client needs h2 installed
+        with patch("httpx.Client") as client_cls:
+            with GitHub(http2=True) as gh:
+                gh._client
+            assert client_cls.call_args.kwargs["http2"] is True
+
+    @pytest.mark.parametrize("has_h2", [True, False])
+    def test_http2_default_follows_h2(self, has_h2):
+        """HTTP/2 is on by default exactly when h2 is installed."""
+        with patch("github_api_client.client.HAS_H2", has_h2):
+            with patch("httpx.Client") as client_cls:
+                with GitHub() as gh:
+                    gh._client
+                assert client_cls.call_args.kwargs["http2"] is has_h2
+
+    def test_clients_share_transport(self, httpx_mock: HTTPXMock):
+        """Clients given one transport share it and leave it open."""
+        httpx_mock.add_response(
+            url="https://api.github.com/repos/octocat/Hello-World",
+            json={"id": 1, "name": "Hello-World"},
+            is_reusable=True,
+        )
+        transport = httpx.HTTPTransport()
+
+        with patch.object(transport, "close") as close:
+            for _ in range(2):
+                with GitHub(transport=transport) as gh:
+                    assert gh._client._transport is transport
+                    gh.repos.get("octocat", "Hello-World")
+            close.assert_not_called()
+        transport.close()
+
+    def test_pagination_batch(self, httpx_mock: HTTPXMock):
+        """Batch pagination fetches pages up to the Link rel="last" page."""
+        url = "https://api.github.com/users/octocat/followers?per_page=100"
+        httpx_mock.add_response(
+            url=f"{url}&page=1",
+            json=[{"id": 1}, {"id": 2}],
+            headers={"Link": f'<{url}&page=2>; rel="next", <{url}&page=3>; rel="last"'},
+        )
+        httpx_mock.add_response(url=f"{url}&page=2", json=[{"id": 3}])
+        httpx_mock.add_response(url=f"{url}&page=3", json=[{"id": 4}])
+
+        with GitHub() as gh:
+            followers = list(gh.users.list_followers("octocat", batch=True))
+            assert [user["id"] for user in followers] == [1, 2, 3, 4]
+
+    def test_pagination_batch_without_link_header(self, httpx_mock: HTTPXMock):
+        """Batch pagination falls back to sequential pages without a Link header."""
+        url = "https://api.github.com/users/octocat/followers?per_page=100"
+        httpx_mock.add_response(url=f"{url}&page=1", json=[{"id": 1}, {"id": 2}])
+        httpx_mock.add_response(url=f"{url}&page=2", json=[{"id": 3}])
+        httpx_mock.add_response(url=f"{url}&page=3", json=[])
+
+        with GitHub() as gh:
+            followers = list(gh.users.list_followers("octocat", batch=True))
+            assert [user["id"] for user in followers] == [1, 2, 3]
+
+    def test_pagination_without_orjson(self, httpx_mock: HTTPXMock):
+        """Pages are decoded with the stdlib when orjson isn't installed."""
+        url = "https://api.github.com/users/octocat/followers?per_page=100"
+        httpx_mock.add_response(url=f"{url}&page=1", json=[{"id": 1}])
+        httpx_mock.add_response(url=f"{url}&page=2", json=[])
+
+        with patch("github_api_client.resources.base.HAS_ORJSON", False):
+            with GitHub() as gh:
+                assert list(gh.users.list_followers("octocat")) == [{"id": 1}]
+
+    def test_get_user_conditional_request(self, httpx_mock: HTTPXMock):
+        """Repeat user lookups send the ETag and reuse the body on 304."""
+        url = "https://api.github.com/users/octocat"
+        httpx_mock.add_response(url=url, json={"login": "octocat"}, headers={"ETag": '"abc"'})
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"abc"'})
+
+        with GitHub() as gh:
+            user = gh.users.get("octocat")
+            assert user == {"login": "octocat"}
+            user["login"] = "edited"
+            assert gh.users.get("octocat") == {"login": "octocat"}
+
+    def test_is_following(self, httpx_mock: HTTPXMock):
+        """is_following maps 204 to True and 404 to False."""
+        url = "https://api.github.com/users/octocat/following"
+        httpx_mock.add_response(url=f"{url}/hubot", status_code=204)
+        httpx_mock.add_response(url=f"{url}/nobody", status_code=404, json={"message": "Not Found"})
+
+        with GitHub() as gh:
+            assert gh.users.is_following("octocat", "hubot") is True
+            assert gh.users.is_following("octocat", "nobody") is False
+
+    def test_is_following_raises_other_errors(self, httpx_mock: HTTPXMock):
+        """is_following doesn't report API errors as "not following"."""
+        httpx_mock.add_response(
+            url="https://api.github.com/users/octocat/following/hubot",
+            status_code=401,
+            json={"message": "Bad credentials"},
+        )
+
+        with GitHub() as gh:
+            with pytest.raises(AuthenticationError):
+                gh.users.is_following("octocat", "hubot")
+
+    def test_add_emails_in_chunks(self, httpx_mock: HTTPXMock):
+        """Long email lists are added 100 at a time, keeping result order."""
+        emails = [f"user{i}@example.com" for i in range(250)]
+        for start in (0, 100, 200):
+            chunk = emails[start : start + 100]
+            httpx_mock.add_response(
+                url="https://api.github.com/user/emails",
+                method="POST",
+                match_json={"emails": chunk},
+                status_code=201,
+                json=[{"email": email} for email in chunk],
+            )
+
+        with GitHub() as gh:
+            added = gh.users.add_emails(emails)
+        assert [item["email"] for item in added] == emails
+
 
 class TestAsyncGitHub:
     """Tests for asynchronous GitHub client."""
@@ -112,6 +289,14 @@ class TestAsyncGitHub:
         assert gh._client is not None
         await gh.close()
 
+    @pytest.mark.asyncio
+    async def test_request_after_close_raises(self):
+        """A closed async client raises instead of building a new httpx client."""
+        gh = AsyncGitHub()
+        await gh.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            await gh.repos.get("octocat", "Hello-World")
+
     @pytest.mark.asyncio
     async def test_context_manager(self):
         """Async client works as context manager."""
@@ -129,3 +314,118 @@ class TestAsyncGitHub:
         async with AsyncGitHub() as gh:
             repo = await gh.repos.get("octocat", "Hello-World")
             assert repo["name"] == "Hello-World"
+
+    @pytest.mark.asyncio
+    async def test_pagination_stops_at_last_page(self, httpx_mock: HTTPXMock):
+        """Async pagination stops once a page's Link header has no rel="next"."""
+        url = "https://api.github.com/users/octocat/followers?per_page=100"
+        httpx_mock.add_response(
+            url=f"{url}&page=1",
+            json=[{"id": 1}],
+            headers={"Link": f'<{url}&page=2>; rel="next", <{url}&page=2>; rel="last"'},
+        )
+        httpx_mock.add_response(
+            url=f"{url}&page=2",
+            json=[{"id": 2}],
+            headers={"Link": f'<{url}&page=1>; rel="prev", <{url}&page=1>; rel="first"'},
+        )
+
+        async with AsyncGitHub() as gh:
+            followers = [user async for user in gh.users.list_followers("octocat")]
+            assert [user["id"] for user in followers] == [1, 2]
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_pagination_batch(self, httpx_mock: HTTPXMock):
+        """Async batch pagination fetches pages up to the Link rel="last" page."""
+        url = "https://api.github.com/users/octocat/followers?per_page=100"
+        httpx_mock.add_response(
+            url=f"{url}&page=1",
+            json=[{"id": 1}, {"id": 2}],
+            headers={"Link": f'<{url}&page=2>; rel="next", <{url}&page=3>; rel="last"'},
+        )
+        httpx_mock.add_response(url=f"{url}&page=2", json=[{"id": 3}])
+        httpx_mock.add_response(url=f"{url}&page=3", json=[{"id": 4}])
+
+        async with AsyncGitHub() as gh:
+            followers = [user async for user in gh.users.list_followers("octocat", batch=True)]
+            assert [user["id"] for user in followers] == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_pagination_batch_without_link_header(self, httpx_mock: HTTPXMock):
+        """Async batch pagination falls back to sequential pages without a Link header."""
+        url = "https://api.github.com/users/octocat/followers?per_page=100"
+        httpx_mock.add_response(url=f"{url}&page=1", json=[{"id": 1}, {"id": 2}])
+        httpx_mock.add_response(url=f"{url}&page=2", json=[{"id": 3}])
+        httpx_mock.add_response(url=f"{url}&page=3", json=[])
+
+        async with AsyncGitHub() as gh:
+            followers = [user async for user in gh.users.list_followers("octocat", batch=True)]
+            assert [user["id"] for user in followers] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_pagination_batch_is_bounded(self, httpx_mock: HTTPXMock):
+        """Batch pagination fetches no further ahead than page_concurrency."""
+        url = "https://api.github.com/users/octocat/followers?per_page=100"
+        httpx_mock.add_response(
+            url=f"{url}&page=1",
+            json=[{"id": 1}],
+            headers={"Link": f'<{url}&page=2>; rel="next", <{url}&page=6>; rel="last"'},
+        )
+        for page in range(2, 7):
+            httpx_mock.add_response(url=f"{url}&page={page}", json=[{"id": page}])
+
+        async with AsyncGitHub(page_concurrency=2) as gh:
+            followers = gh.users.list_followers("octocat", batch=True)
+            assert (await followers.__anext__())["id"] == 1
+            assert (await followers.__anext__())["id"] == 2
+            for _ in range(10):
+                await asyncio.sleep(0)
+            # Pages 3 and 4 are prefetched; 5 and 6 wait for the consumer
+            assert len(httpx_mock.get_requests()) == 4
+            assert [user["id"] async for user in followers] == [3, 4, 5, 6]
+
+    @pytest.mark.asyncio
+    async def test_get_user_conditional_request(self, httpx_mock: HTTPXMock):
+        """Async repeat user lookups send the ETag and reuse the body on 304."""
+        url = "https://api.github.com/user"
+        httpx_mock.add_response(url=url, json={"login": "octocat"}, headers={"ETag": '"abc"'})
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"abc"'})
+
+        async with AsyncGitHub() as gh:
+            assert await gh.users.get_authenticated() == {"login": "octocat"}
+            assert await gh.users.get_authenticated() == {"login": "octocat"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_request(self, httpx_mock: HTTPXMock):
+        """Concurrent lookups of the same URL are sent once."""
+        httpx_mock.add_response(
+            url="https://api.github.com/repos/octocat/Hello-World",
+            json={"id": 1, "name": "Hello-World"},
+        )
+
+        async with AsyncGitHub() as gh:
+            first, second = await asyncio.gather(
+                gh.repos.get("octocat", "Hello-World"),
+                gh.repos.get("octocat", "Hello-World"),
+            )
+            assert first == second == {"id": 1, "name": "Hello-World"}
+            assert first is not second
+            assert gh._inflight == {}
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_emails_in_chunks(self, httpx_mock: HTTPXMock):
+        """Async long email lists are deleted 100 at a time."""
+        emails = [f"user{i}@example.com" for i in range(150)]
+        for start in (0, 100):
+            httpx_mock.add_response(
+                url="https://api.github.com/user/emails",
+                method="DELETE",
+                match_json={"emails": emails[start : start + 100]},
+                status_code=204,
+            )
+
+        async with AsyncGitHub() as gh:
+            await gh.users.delete_emails(emails)
+        assert len(httpx_mock.get_requests()) == 2
@@ -1,5 +1,6 @@
 """Tests for typed models."""
 
+from dataclasses import fields
 from datetime import datetime, timezone
 
 import pytest
@@ -15,6 +16,33 @@ from github_api_client.models import (
     _parse_datetime,
 )
 
+_PRIVATE_FIELDS = ("_raw", "_repo", "_client")
+_ASSIGNEE = {"login": "assignee-1", "id": 101}
+_LABEL = {"id": 102, "name": "value-label"}
+_MILESTONE = {"id": 103, "number": 1, "title": "value-milestone"}
+_ISSUE_NESTED = {"assignees": [_ASSIGNEE], "labels": [_LABEL], "milestone": _MILESTONE}
+
+
+def _mapping_case(model, *, users=(), dates=(), data=None, expected=None):
+    """Build a (model, data, expected) case giving every field a distinct value.
+
+    Fields not read from the key of the same name are passed in data and expected.
+    """
+    data = dict(data or {})
+    expected = dict(expected or {})
+    for i, f in enumerate(fields(model), start=1):
+        if f.name in _PRIVATE_FIELDS or f.name in expected:
+            continue
+        if f.name in users:
+            data[f.name] = {"login": f.name, "id": i}
+            expected[f.name] = User.from_dict(data[f.name])
+        elif f.name in dates:
+            data[f.name] = f"2024-01-{i:02d}T00:00:00Z"
+            expected[f.name] = datetime(2024, 1, i, tzinfo=timezone.utc)
+        else:
+            data[f.name] = expected[f.name] = f"value-{f.name}"
+    return pytest.param(model, data, expected, id=model.__name__)
+
 
 class TestParseDatetime:
     """Tests for datetime parsing."""
@@ -33,6 +61,15 @@ class TestParseDatetime:
         """Returns None for None input."""
         assert _parse_datetime(None) is None
 
+    def test_parse_reuses_cached_value(self):
+        """Repeated timestamps return the already parsed datetime."""
+        first = _parse_datetime("2024-02-01T08:00:00Z")
+        assert _parse_datetime("2024-02-01T08:00:00Z") is first
+
+    def test_parse_z_uses_utc_singleton(self):
+        """A Z suffix yields the shared timezone.utc instance."""
+        assert _parse_datetime("2024-01-15T10:30:00Z").tzinfo is timezone.utc
+
 
 class TestUser:
     """Tests for User model."""
@@ -122,7 +159,7 @@ class TestMilestone:
 class TestIssue:
     """Tests for Issue model."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def issue_data(self):
         """Sample issue data."""
         return {
@@ -179,21 +216,45 @@ class TestIssue:
         assert issue.is_open is True
         assert issue.is_closed is False
 
-        issue_data["state"] = "closed"
-        issue = Issue.from_dict(issue_data)
+        issue = Issue.from_dict({**issue_data, "state": "closed"})
         assert issue.is_open is False
         assert issue.is_closed is True
 
     def test_raw_data_preserved(self, issue_data):
         """Raw data is preserved in _raw attribute."""
-        issue = Issue.from_dict(issue_data)
+        issue = Issue.from_dict(issue_data, keep_raw=True)
         assert issue._raw == issue_data
+        assert issue.user._raw == issue_data["user"]
+
+    def test_repeated_user_is_shared(self, issue_data):
+        """The same user appearing twice in an issue is parsed once."""
+        other = {"login": "hubot", "id": 2}
+        data = {
+            **issue_data,
+            "assignee": issue_data["user"],
+            "assignees": [issue_data["user"], other],
+        }
+        issue = Issue.from_dict(data)
+        assert issue.user is issue.assignee is issue.assignees[0]
+        assert issue.assignees[1].login == "hubot"
+
+    def test_raw_data_dropped_by_default(self, issue_data):
+        """Raw data is not retained unless requested."""
+        issue = Issue.from_dict(issue_data)
+        assert issue._raw == {}
+        assert issue.user._raw == {}
+
+    def test_instances_have_no_dict(self, issue_data):
+        """Models use slots, so instances carry no per-object __dict__."""
+        issue = Issue.from_dict(issue_data)
+        assert not hasattr(issue, "__dict__")
+        assert not hasattr(issue.user, "__dict__")
 
 
 class TestPullRequest:
     """Tests for PullRequest model."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def pr_data(self):
         """Sample pull request data."""
         return {
@@ -255,15 +316,14 @@ class TestPullRequest:
         pr = PullRequest.from_dict(pr_data)
         assert pr.is_merged is False
 
-        pr_data["merged"] = True
-        pr = PullRequest.from_dict(pr_data)
+        pr = PullRequest.from_dict({**pr_data, "merged": True})
         assert pr.is_merged is True
 
 
 class TestRepository:
     """Tests for Repository model."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def repo_data(self):
         """Sample repository data."""
         return {
@@ -359,3 +419,57 @@ class TestComment:
         assert comment.id == 1
         assert comment.body == "Great work!"
         assert comment.user.login == "octocat"
+
+
+class TestFieldMapping:
+    """Tests that from_dict reads every field from the API data."""
+
+    @pytest.mark.parametrize(
+        "model, data, expected",
+        [
+            _mapping_case(User, dates=("created_at", "updated_at")),
+            _mapping_case(Label),
+            _mapping_case(Milestone, dates=("created_at", "updated_at", "due_on", "closed_at")),
+            _mapping_case(Comment, users=("user",), dates=("created_at", "updated_at")),
+            _mapping_case(
+                Issue,
+                users=("user", "assignee", "closed_by"),
+                dates=("created_at", "updated_at", "closed_at"),
+                data=_ISSUE_NESTED,
+                expected={
+                    "assignees": [User.from_dict(_ASSIGNEE)],
+                    "labels": [Label.from_dict(_LABEL)],
+                    "milestone": Milestone.from_dict(_MILESTONE),
+                },
+            ),
+            _mapping_case(
+                PullRequest,
+                users=("user", "assignee", "merged_by"),
+                dates=("created_at", "updated_at", "closed_at", "merged_at"),
+                data={
+                    **_ISSUE_NESTED,
+                    "head": {"ref": "value-head_ref", "sha": "value-head_sha"},
+                    "base": {"ref": "value-base_ref", "sha": "value-base_sha"},
+                },
+                expected={
+                    "assignees": [User.from_dict(_ASSIGNEE)],
+                    "labels": [Label.from_dict(_LABEL)],
+                    "milestone": Milestone.from_dict(_MILESTONE),
+                    "head_ref": "value-head_ref",
+                    "head_sha": "value-head_sha",
+                    "base_ref": "value-base_ref",
+                    "base_sha": "value-base_sha",
+                },
+            ),
+            _mapping_case(
+                Repository, users=("owner",), dates=("pushed_at", "created_at", "updated_at")
+            ),
+            _mapping_case(
+                Branch, data={"commit": {"sha": "value-sha"}}, expected={"sha": "value-sha"}
+            ),
+        ],
+    )
+    def test_from_dict_maps_every_field(self, model, data, expected):
+        """Each API key lands on its field."""
+        obj = model.from_dict(data)
+        assert {name: getattr(obj, name) for name in expected} == expected
@@ -1,14 +1,18 @@
 """Tests for methods on Issue and PullRequest objects."""
 
+import json
+
 import pytest
 from github_api_client import Comment, GitHub, Issue, PullRequest
 from pytest_httpx import HTTPXMock
 
+_JSON_HEADERS = {"content-type": "application/json"}
+
 
 class TestIssueMethods:
     """Tests for methods on Issue objects."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def issue_data(self):
         """Sample issue data."""
         return {
@@ -37,11 +41,17 @@ class TestIssueMethods:
             "closed_by": None,
         }
 
-    def test_issue_close(self, httpx_mock: HTTPXMock, issue_data):
+    @pytest.fixture(scope="module")
+    def issue_body(self, issue_data):
+        """Sample issue data encoded once as a JSON response body."""
+        return json.dumps(issue_data).encode()
+
+    def test_issue_close(self, httpx_mock: HTTPXMock, issue_data, issue_body):
         """issue.close() closes the issue."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42",
-            json=issue_data,
+            content=issue_body,
+            headers=_JSON_HEADERS,
         )
         closed_data = {**issue_data, "state": "closed"}
         httpx_mock.add_response(
@@ -59,12 +69,12 @@ class TestIssueMethods:
 
     def test_issue_reopen(self, httpx_mock: HTTPXMock, issue_data):
         """issue.reopen() reopens the issue."""
-        issue_data["state"] = "closed"
+        closed_data = {**issue_data, "state": "closed"}
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42",
-            json=issue_data,
+            json=closed_data,
         )
-        reopened_data = {**issue_data, "state": "open"}
+        reopened_data = {**closed_data, "state": "open"}
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42",
             method="PATCH",
@@ -77,11 +87,12 @@ class TestIssueMethods:
             reopened = issue.reopen()
             assert reopened.state == "open"
 
-    def test_issue_add_comment(self, httpx_mock: HTTPXMock, issue_data):
+    def test_issue_add_comment(self, httpx_mock: HTTPXMock, issue_body):
         """issue.add_comment() adds a comment."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42",
-            json=issue_data,
+            content=issue_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42/comments",
@@ -109,11 +120,12 @@ class TestIssueMethods:
             assert isinstance(comment, Comment)
             assert comment.body == "Thanks!"
 
-    def test_issue_add_labels(self, httpx_mock: HTTPXMock, issue_data):
+    def test_issue_add_labels(self, httpx_mock: HTTPXMock, issue_body):
         """issue.add_labels() adds labels."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42",
-            json=issue_data,
+            content=issue_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42/labels",
@@ -131,11 +143,12 @@ class TestIssueMethods:
             assert len(labels) == 2
             assert labels[0].name == "bug"
 
-    def test_issue_lock(self, httpx_mock: HTTPXMock, issue_data):
+    def test_issue_lock(self, httpx_mock: HTTPXMock, issue_body):
         """issue.lock() locks the issue."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42",
-            json=issue_data,
+            content=issue_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42/lock",
@@ -148,11 +161,12 @@ class TestIssueMethods:
             issue = repo.issues.get(42)
             issue.lock(reason="resolved")  # Should not raise
 
-    def test_issue_list_comments(self, httpx_mock: HTTPXMock, issue_data):
+    def test_issue_list_comments(self, httpx_mock: HTTPXMock, issue_body):
         """issue.list_comments() returns comments."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42",
-            json=issue_data,
+            content=issue_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/42/comments?per_page=30&page=1",
@@ -216,7 +230,7 @@ class TestIssueMethods:
 class TestPullRequestMethods:
     """Tests for methods on PullRequest objects."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def pr_data(self):
         """Sample PR data."""
         return {
@@ -255,11 +269,17 @@ class TestPullRequestMethods:
             "merged_by": None,
         }
 
-    def test_pr_approve(self, httpx_mock: HTTPXMock, pr_data):
+    @pytest.fixture(scope="module")
+    def pr_body(self, pr_data):
+        """Sample PR data encoded once as a JSON response body."""
+        return json.dumps(pr_data).encode()
+
+    def test_pr_approve(self, httpx_mock: HTTPXMock, pr_body):
         """pr.approve() approves the PR."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123",
-            json=pr_data,
+            content=pr_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123/reviews",
@@ -273,11 +293,12 @@ class TestPullRequestMethods:
             result = pr.approve(body="LGTM!")
             assert result["state"] == "APPROVED"
 
-    def test_pr_request_changes(self, httpx_mock: HTTPXMock, pr_data):
+    def test_pr_request_changes(self, httpx_mock: HTTPXMock, pr_body):
         """pr.request_changes() requests changes."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123",
-            json=pr_data,
+            content=pr_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123/reviews",
@@ -291,11 +312,12 @@ class TestPullRequestMethods:
             result = pr.request_changes("Please fix X")
             assert result["state"] == "CHANGES_REQUESTED"
 
-    def test_pr_comment(self, httpx_mock: HTTPXMock, pr_data):
+    def test_pr_comment(self, httpx_mock: HTTPXMock, pr_body):
         """pr.comment() adds a review comment."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123",
-            json=pr_data,
+            content=pr_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123/reviews",
@@ -309,11 +331,12 @@ class TestPullRequestMethods:
             result = pr.comment("Looking good")
             assert result["state"] == "COMMENTED"
 
-    def test_pr_merge(self, httpx_mock: HTTPXMock, pr_data):
+    def test_pr_merge(self, httpx_mock: HTTPXMock, pr_body):
         """pr.merge() merges the PR."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123",
-            json=pr_data,
+            content=pr_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123/merge",
@@ -327,11 +350,12 @@ class TestPullRequestMethods:
             result = pr.merge(merge_method="squash")
             assert result["merged"] is True
 
-    def test_pr_close(self, httpx_mock: HTTPXMock, pr_data):
+    def test_pr_close(self, httpx_mock: HTTPXMock, pr_data, pr_body):
         """pr.close() closes the PR."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123",
-            json=pr_data,
+            content=pr_body,
+            headers=_JSON_HEADERS,
         )
         closed_data = {**pr_data, "state": "closed"}
         httpx_mock.add_response(
@@ -347,16 +371,18 @@ class TestPullRequestMethods:
             assert isinstance(closed_pr, PullRequest)
             assert closed_pr.state == "closed"
 
-    def test_pr_request_reviewers(self, httpx_mock: HTTPXMock, pr_data):
+    def test_pr_request_reviewers(self, httpx_mock: HTTPXMock, pr_body):
         """pr.request_reviewers() requests reviewers."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123",
-            json=pr_data,
+            content=pr_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123/requested_reviewers",
             method="POST",
-            json=pr_data,
+            content=pr_body,
+            headers=_JSON_HEADERS,
         )
 
         with GitHub(token="test") as gh:
@@ -365,11 +391,12 @@ class TestPullRequestMethods:
             result = pr.request_reviewers(reviewers=["alice", "bob"])
             assert isinstance(result, PullRequest)
 
-    def test_pr_add_comment(self, httpx_mock: HTTPXMock, pr_data):
+    def test_pr_add_comment(self, httpx_mock: HTTPXMock, pr_body):
         """pr.add_comment() adds an issue comment."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123",
-            json=pr_data,
+            content=pr_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/issues/123/comments",
@@ -397,11 +424,12 @@ class TestPullRequestMethods:
             assert isinstance(comment, Comment)
             assert comment.body == "Comment on PR"
 
-    def test_pr_list_files(self, httpx_mock: HTTPXMock, pr_data):
+    def test_pr_list_files(self, httpx_mock: HTTPXMock, pr_body):
         """pr.list_files() returns changed files."""
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123",
-            json=pr_data,
+            content=pr_body,
+            headers=_JSON_HEADERS,
         )
         httpx_mock.add_response(
             url="https://api.github.com/repos/owner/repo/pulls/123/files?per_page=30&page=1",
@@ -3,8 +3,10 @@
 import time
 from unittest.mock import patch
 
+import httpx
 import pytest
 from github_api_client import GitHub, RateLimitError
+from github_api_client.client import _MAX_RETRY_WAIT, _get_retry_after
 from pytest_httpx import HTTPXMock
 
 
@@ -76,6 +78,32 @@ class TestRateLimitHandling:
                 with pytest.raises(RateLimitError):
                     gh.users.get_authenticated()
 
+    def test_auto_retry_backs_off_without_hint(self, httpx_mock: HTTPXMock):
+        """Without retry headers the wait doubles on each retry, plus jitter, up to a cap."""
+        for _ in range(4):
+            httpx_mock.add_response(
+                url="https://api.github.com/user",
+                status_code=429,
+                json={"message": "API rate limit exceeded"},
+            )
+
+        with patch("time.sleep") as mock_sleep:
+            with GitHub(token="test", auto_retry=True, max_retries=3) as gh:
+                with pytest.raises(RateLimitError):
+                    gh.users.get_authenticated()
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        for attempt, wait in enumerate(waits):
+            base = min(120, 60 * 2**attempt)
+            assert base <= wait <= base * 1.5
+        assert len(waits) == 3
+
+    def test_backoff_is_capped(self):
+        """Backoff without retry headers never exceeds the cap, however many retries."""
+        response = httpx.Response(429)
+        with patch("random.random", return_value=1.0):
+            for attempt in (5, 20, 100):
+                assert _get_retry_after(response, attempt) == _MAX_RETRY_WAIT * 1.5
+
     def test_auto_retry_uses_x_ratelimit_reset(self, httpx_mock: HTTPXMock):
         """Auto retry uses X-RateLimit-Reset header."""
         future_time = int(time.time()) + 5
@@ -99,6 +127,39 @@ class TestRateLimitHandling:
                 call_args = mock_sleep.call_args[0][0]
                 assert 4 <= call_args <= 6
 
+    def test_auto_retry_waits_out_exhausted_limit(self, httpx_mock: HTTPXMock):
+        """After a response uses the last request, the next waits for the reset."""
+        reset_at = int(time.time()) + 5
+        httpx_mock.add_response(
+            url="https://api.github.com/user",
+            json={"login": "octocat", "id": 1},
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)},
+        )
+        httpx_mock.add_response(
+            url="https://api.github.com/users/octocat",
+            json={"login": "octocat", "id": 1},
+        )
+
+        with patch("time.sleep") as mock_sleep:
+            with GitHub(token="test", auto_retry=True) as gh:
+                gh.users.get_authenticated()
+                mock_sleep.assert_not_called()
+                gh.users.get("octocat")
+                assert 4 <= mock_sleep.call_args[0][0] <= 6
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_exhausted_limit_is_per_resource(self, httpx_mock: HTTPXMock):
+        """An exhausted search limit doesn't delay core requests."""
+        httpx_mock.add_response(
+            url="https://api.github.com/user", json={"login": "octocat", "id": 1}
+        )
+
+        with patch("time.sleep") as mock_sleep:
+            with GitHub(token="test", auto_retry=True) as gh:
+                gh._rate_limit_resets["search"] = time.time() + 5
+                gh.users.get_authenticated()
+                mock_sleep.assert_not_called()
+
     def test_no_retry_when_disabled(self, httpx_mock: HTTPXMock):
         """No retry when auto_retry is False."""
         httpx_mock.add_response(
@@ -165,3 +226,23 @@ class TestRateLimitHandling:
             with GitHub(token="test", auto_retry=True) as gh:
                 repos = list(gh.repos.list_for_user("octocat"))
                 assert len(repos) == 2
+
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_auto_retry_in_search(self, httpx_mock: HTTPXMock, batch):
+        """Search pages are retried on rate limits like other requests."""
+        url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1"
+        httpx_mock.add_response(
+            url=url,
+            status_code=429,
+            json={"message": "You have exceeded a secondary rate limit."},
+            headers={"Retry-After": "0"},
+        )
+        httpx_mock.add_response(
+            url=url,
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+        )
+
+        with patch("time.sleep"):
+            with GitHub(token="test", auto_retry=True) as gh:
+                assert list(gh.search.issues("bug", batch=batch)) == [{"id": 1}]
+        assert len(httpx_mock.get_requests()) == 2
@@ -3,7 +3,8 @@
 import tempfile
 from pathlib import Path
 
-from github_api_client import GitHub
+import pytest
+from github_api_client import AsyncGitHub, GitHub
 from pytest_httpx import HTTPXMock
 
 
@@ -30,6 +31,25 @@ class TestReleases:
             assert releases[0]["tag_name"] == "v1.0.0"
             assert releases[1]["tag_name"] == "v0.9.0"
 
+    def test_list_releases_stops_at_last_page(self, httpx_mock: HTTPXMock):
+        """Listing stops once a page's Link header has no rel="next"."""
+        url = "https://api.github.com/repos/owner/repo/releases?per_page=30"
+        httpx_mock.add_response(
+            url=f"{url}&page=1",
+            json=[{"id": 1, "tag_name": "v1.0.0"}],
+            headers={"Link": f'<{url}&page=2>; rel="next", <{url}&page=2>; rel="last"'},
+        )
+        httpx_mock.add_response(
+            url=f"{url}&page=2",
+            json=[{"id": 2, "tag_name": "v0.9.0"}],
+            headers={"Link": f'<{url}&page=1>; rel="prev", <{url}&page=1>; rel="first"'},
+        )
+
+        with GitHub(token="test-token") as gh:
+            releases = list(gh.releases.list("owner", "repo"))
+            assert [release["id"] for release in releases] == [1, 2]
+        assert len(httpx_mock.get_requests()) == 2
+
     def test_get_release(self, httpx_mock: HTTPXMock):
         """Get release by ID."""
         httpx_mock.add_response(
@@ -53,6 +73,19 @@ class TestReleases:
             release = gh.releases.get_latest("owner", "repo")
             assert release["tag_name"] == "v1.0.0"
 
+    def test_get_latest_release_conditional_request(self, httpx_mock: HTTPXMock):
+        """Repeat lookups send the ETag and reuse the body on 304."""
+        url = "https://api.github.com/repos/owner/repo/releases/latest"
+        httpx_mock.add_response(
+            url=url, json={"id": 123, "tag_name": "v1.0.0"}, headers={"ETag": '"abc"'}
+        )
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"abc"'})
+
+        with GitHub(token="test-token") as gh:
+            first = gh.releases.get_latest("owner", "repo")
+            first["tag_name"] = "edited"
+            assert gh.releases.get_latest("owner", "repo") == {"id": 123, "tag_name": "v1.0.0"}
+
     def test_get_release_by_tag(self, httpx_mock: HTTPXMock):
         """Get release by tag name."""
         httpx_mock.add_response(
@@ -139,6 +172,38 @@ class TestReleases:
             finally:
                 Path(temp_path).unlink()
 
+    def test_upload_asset_streams_file(self, httpx_mock: HTTPXMock, tmp_path):
+        """The asset is sent from the file with its size as Content-Length."""
+        asset_path = tmp_path / "dist.tar.gz"
+        asset_path.write_bytes(b"x" * 100_000)
+        httpx_mock.add_response(
+            url="https://uploads.github.com/repos/owner/repo/releases/123/assets?name=dist.tar.gz",
+            method="POST",
+            json={"id": 456, "name": "dist.tar.gz"},
+            match_headers={"Content-Length": "100000"},
+        )
+
+        with GitHub(token="test-token") as gh:
+            gh.releases.upload_asset("owner", "repo", 123, asset_path)
+        assert httpx_mock.get_request().content == b"x" * 100_000
+
+    @pytest.mark.asyncio
+    async def test_async_upload_asset(self, httpx_mock: HTTPXMock, tmp_path):
+        """The async client streams the asset in chunks."""
+        asset_path = tmp_path / "dist.tar.gz"
+        asset_path.write_bytes(b"x" * 3_000_000)
+        httpx_mock.add_response(
+            url="https://uploads.github.com/repos/owner/repo/releases/123/assets?name=dist.tar.gz",
+            method="POST",
+            json={"id": 456, "name": "dist.tar.gz"},
+            match_headers={"Content-Length": "3000000"},
+        )
+
+        async with AsyncGitHub(token="test-token") as gh:
+            asset = await gh.releases.upload_asset("owner", "repo", 123, asset_path)
+            assert asset["id"] == 456
+        assert httpx_mock.get_request().content == b"x" * 3_000_000
+
     def test_delete_asset(self, httpx_mock: HTTPXMock):
         """Delete a release asset."""
         httpx_mock.add_response(
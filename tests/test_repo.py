@@ -1,7 +1,7 @@
 """Tests for repository-bound interface."""
 
 import pytest
-from github_api_client import Branch, GitHub, Issue, PullRequest, Repository, User
+from github_api_client import Branch, GitHub, GitHubError, Issue, PullRequest, Repository, User
 from pytest_httpx import HTTPXMock
 
 
@@ -23,6 +23,13 @@ class TestRepoInterface:
             assert repo.owner == "owner"
             assert repo.name == "repo"
 
+    def test_repo_is_reused(self):
+        """Both spellings of a repo return the same object."""
+        with GitHub(token=None) as gh:
+            repo = gh.repo("owner/repo")
+            assert gh.repo("owner", "repo") is repo
+            assert gh.repo("owner/other") is not repo
+
     def test_repo_invalid_format(self):
         """Raises error for invalid format."""
         with GitHub(token=None) as gh:
@@ -74,11 +81,26 @@ class TestRepoGet:
             assert info.stars == 100
             assert info.language == "Python"
 
+    def test_get_conditional_request(self, httpx_mock: HTTPXMock):
+        """Repeat repo.get() calls send the ETag and reuse the body on 304."""
+        url = "https://api.github.com/repos/owner/repo"
+        httpx_mock.add_response(
+            url=url,
+            json={"id": 1, "name": "repo", "full_name": "owner/repo"},
+            headers={"ETag": '"abc"'},
+        )
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"abc"'})
+
+        with GitHub(token=None) as gh:
+            repo = gh.repo("owner/repo")
+            assert repo.get().full_name == "owner/repo"
+            assert repo.get().full_name == "owner/repo"
+
 
 class TestRepoIssues:
     """Tests for repo.issues operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def issue_response(self):
         """Sample issue response data."""
         return {
@@ -139,6 +161,22 @@ class TestRepoIssues:
             assert len(issues) == 1
             assert isinstance(issues[0], Issue)
 
+    def test_issues_list_batch(self, httpx_mock: HTTPXMock, issue_response):
+        """repo.issues.list(batch=True) fetches pages up to the Link rel="last" page."""
+        url = "https://api.github.com/repos/owner/repo/issues?state=open&sort=created&direction=desc&per_page=30"
+        httpx_mock.add_response(
+            url=f"{url}&page=1",
+            json=[issue_response],
+            headers={"Link": f'<{url}&page=2>; rel="next", <{url}&page=3>; rel="last"'},
+        )
+        httpx_mock.add_response(url=f"{url}&page=2", json=[{**issue_response, "number": 43}])
+        httpx_mock.add_response(url=f"{url}&page=3", json=[{**issue_response, "number": 44}])
+
+        with GitHub(token=None, page_concurrency=2) as gh:
+            repo = gh.repo("owner/repo")
+            issues = list(repo.issues.list(batch=True))
+            assert [issue.number for issue in issues] == [42, 43, 44]
+
     def test_issues_create_returns_issue(self, httpx_mock: HTTPXMock, issue_response):
         """repo.issues.create() returns Issue object."""
         httpx_mock.add_response(
@@ -153,11 +191,31 @@ class TestRepoIssues:
             assert isinstance(issue, Issue)
             assert issue.title == "Test issue"
 
+    def test_issues_update_without_fields_skips_patch(self, httpx_mock: HTTPXMock, issue_response):
+        """repo.issues.update() with no fields fetches instead of patching."""
+        httpx_mock.add_response(
+            url="https://api.github.com/repos/owner/repo/issues/42",
+            method="GET",
+            json=issue_response,
+        )
+
+        with GitHub(token="test") as gh:
+            repo = gh.repo("owner/repo")
+            issue = repo.issues.update(42)
+            assert issue.number == 42
+
+    def test_issues_update_rejects_unknown_field(self):
+        """repo.issues.update() raises TypeError for unknown fields."""
+        with GitHub(token="test") as gh:
+            repo = gh.repo("owner/repo")
+            with pytest.raises(TypeError, match="stat"):
+                repo.issues.update(42, stat="closed")
+
 
 class TestRepoPulls:
     """Tests for repo.pulls operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def pr_response(self):
         """Sample PR response data."""
         return {
@@ -228,6 +286,43 @@ class TestRepoPulls:
             assert len(prs) == 1
             assert isinstance(prs[0], PullRequest)
 
+    def test_pulls_is_merged_true(self, httpx_mock: HTTPXMock):
+        """repo.pulls.is_merged() returns True on 204."""
+        httpx_mock.add_response(
+            url="https://api.github.com/repos/owner/repo/pulls/123/merge",
+            method="HEAD",
+            status_code=204,
+        )
+
+        with GitHub(token="test") as gh:
+            repo = gh.repo("owner/repo")
+            assert repo.pulls.is_merged(123) is True
+
+    def test_pulls_is_merged_false(self, httpx_mock: HTTPXMock):
+        """repo.pulls.is_merged() returns False on 404."""
+        httpx_mock.add_response(
+            url="https://api.github.com/repos/owner/repo/pulls/123/merge",
+            method="HEAD",
+            status_code=404,
+        )
+
+        with GitHub(token="test") as gh:
+            repo = gh.repo("owner/repo")
+            assert repo.pulls.is_merged(123) is False
+
+    def test_pulls_is_merged_raises_on_server_error(self, httpx_mock: HTTPXMock):
+        """repo.pulls.is_merged() raises on errors other than 404."""
+        httpx_mock.add_response(
+            url="https://api.github.com/repos/owner/repo/pulls/123/merge",
+            method="HEAD",
+            status_code=500,
+        )
+
+        with GitHub(token="test") as gh:
+            repo = gh.repo("owner/repo")
+            with pytest.raises(GitHubError):
+                repo.pulls.is_merged(123)
+
 
 class TestRepoBranches:
     """Tests for repo.branches()."""
@@ -1,6 +1,12 @@
 """Tests for search API."""
 
-from github_api_client import GitHub
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from github_api_client import AsyncGitHub, GitHub
+from github_api_client.exceptions import NotFoundError
+from github_api_client.resources.search import HAS_IJSON
 from pytest_httpx import HTTPXMock
 
 
@@ -122,6 +128,7 @@ class TestSearch:
         # First page
         httpx_mock.add_response(
             url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            headers={"Link": '<https://api.github.com/search/issues?q=bug&page=2>; rel="next"'},
             json={
                 "total_count": 150,
                 "incomplete_results": False,
@@ -142,6 +149,44 @@ class TestSearch:
             results = list(gh.search.issues("bug"))
             assert len(results) == 150
 
+    def test_search_pagination_stops_without_next_link(self, httpx_mock: HTTPXMock):
+        """Search stops after a full page when no rel="next" link is sent."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={
+                "total_count": 100,
+                "incomplete_results": False,
+                "items": [{"id": i} for i in range(100)],
+            },
+        )
+
+        with GitHub(token=None) as gh:
+            results = list(gh.search.issues("bug"))
+            assert len(results) == 100
+
+    def test_search_is_lazy(self, httpx_mock: HTTPXMock):
+        """Results are fetched only as they are consumed."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100"
+        httpx_mock.add_response(
+            url=f"{base_url}&page=1",
+            headers={"Link": f'<{base_url}&page=2>; rel="next"'},
+            json={"total_count": 200, "incomplete_results": False, "items": [{"id": 1}]},
+        )
+
+        with GitHub(token=None) as gh:
+            assert next(gh.search.issues("bug")) == {"id": 1}
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_search_per_page(self, httpx_mock: HTTPXMock):
+        """Search passes a custom page size through to the API."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=5&page=1",
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+        )
+
+        with GitHub(token=None) as gh:
+            assert next(gh.search.issues("bug", per_page=5)) == {"id": 1}
+
     def test_search_empty_results(self, httpx_mock: HTTPXMock):
         """Search handles empty results."""
         httpx_mock.add_response(
@@ -156,3 +201,437 @@ class TestSearch:
         with GitHub(token=None) as gh:
             results = list(gh.search.issues("nonexistent"))
             assert len(results) == 0
+
+    def test_search_pagination_batch(self, httpx_mock: HTTPXMock):
+        """Batch search fetches remaining pages and keeps result order."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100"
+        for page, start, stop in [(1, 0, 100), (2, 100, 200), (3, 200, 250)]:
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                json={
+                    "total_count": 250,
+                    "incomplete_results": False,
+                    "items": [{"id": i} for i in range(start, stop)],
+                },
+            )
+
+        with GitHub(token=None) as gh:
+            results = list(gh.search.issues("bug", batch=True))
+            assert [item["id"] for item in results] == list(range(250))
+
+    def test_search_per_page_capped_at_100(self, httpx_mock: HTTPXMock):
+        """A per_page over 100 is capped, so batch search fetches every page."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100"
+        for page, start, stop in [(1, 0, 100), (2, 100, 200), (3, 200, 250)]:
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                json={
+                    "total_count": 250,
+                    "incomplete_results": False,
+                    "items": [{"id": i} for i in range(start, stop)],
+                },
+            )
+
+        with GitHub(token=None) as gh:
+            results = list(gh.search.issues("bug", batch=True, per_page=200))
+            assert [item["id"] for item in results] == list(range(250))
+
+    def test_search_per_page_at_least_1(self, httpx_mock: HTTPXMock):
+        """A per_page below 1 is raised to 1."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=1"
+        for page in (1, 2):
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                json={"total_count": 2, "incomplete_results": False, "items": [{"id": page}]},
+            )
+
+        with GitHub(token=None) as gh:
+            results = list(gh.search.issues("bug", batch=True, per_page=0))
+            assert [item["id"] for item in results] == [1, 2]
+
+    def test_search_conditional_request(self, httpx_mock: HTTPXMock):
+        """Repeat searches send the page ETag and reuse the items on 304."""
+        url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1"
+        httpx_mock.add_response(
+            url=url,
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+            headers={"ETag": '"abc"'},
+        )
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"abc"'})
+
+        with GitHub(token=None) as gh:
+            results = list(gh.search.issues("bug"))
+            assert results == [{"id": 1}]
+            results[0]["id"] = 2
+            assert list(gh.search.issues("bug")) == [{"id": 1}]
+
+    def test_search_batch_reuses_cached_pages(self, httpx_mock: HTTPXMock):
+        """Pages cached by an item-by-item search serve a later batch search on 304."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100"
+        for page, start, stop in [(1, 0, 100), (2, 100, 150)]:
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                headers={
+                    "ETag": f'"page{page}"',
+                    **({"Link": f'<{base_url}&page=2>; rel="next"'} if page == 1 else {}),
+                },
+                json={
+                    "total_count": 150,
+                    "incomplete_results": False,
+                    "items": [{"id": i} for i in range(start, stop)],
+                },
+            )
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                status_code=304,
+                match_headers={"If-None-Match": f'"page{page}"'},
+            )
+
+        with GitHub(token=None) as gh:
+            assert [item["id"] for item in gh.search.issues("bug")] == list(range(150))
+            results = list(gh.search.issues("bug", batch=True))
+            assert [item["id"] for item in results] == list(range(150))
+
+    @pytest.mark.skipif(not HAS_IJSON, reason="ijson is not installed")
+    def test_search_streamed_pages_are_not_cached(self, httpx_mock: HTTPXMock):
+        """Streamed pages are not kept, so a repeat search fetches them in full."""
+        url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1"
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=url,
+                json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+                headers={"ETag": '"abc"'},
+            )
+
+        with patch("github_api_client.resources.search._STREAM_MIN_BYTES", 0):
+            with GitHub(token=None) as gh:
+                assert list(gh.search.issues("bug")) == [{"id": 1}]
+                assert list(gh.search.issues("bug")) == [{"id": 1}]
+        assert "If-None-Match" not in httpx_mock.get_requests()[1].headers
+
+    def test_search_pagination_without_ijson(self, httpx_mock: HTTPXMock):
+        """Search falls back to decoding whole pages when ijson is missing."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100"
+        for page, start, stop in [(1, 0, 100), (2, 100, 150)]:
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                headers={"Link": f'<{base_url}&page=2>; rel="next"'} if page == 1 else {},
+                json={
+                    "total_count": 150,
+                    "incomplete_results": False,
+                    "items": [{"id": i, "score": 1.5} for i in range(start, stop)],
+                },
+            )
+
+        with patch("github_api_client.resources.search.HAS_IJSON", False):
+            with GitHub(token=None) as gh:
+                results = list(gh.search.issues("bug"))
+        assert [item["id"] for item in results] == list(range(150))
+        assert results[0]["score"] == 1.5
+
+    def test_search_batch_without_orjson(self, httpx_mock: HTTPXMock):
+        """Batch search decodes pages with the stdlib when orjson is missing."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+        )
+
+        with patch("github_api_client.resources.base.HAS_ORJSON", False):
+            with GitHub(token=None) as gh:
+                assert list(gh.search.issues("bug", batch=True)) == [{"id": 1}]
+
+    def test_search_streamed_items_match_json(self, httpx_mock: HTTPXMock):
+        """Streamed items decode nested values and floats like response.json()."""
+        item = {
+            "id": 1,
+            "score": 1.5,
+            "labels": [{"name": "bug"}],
+            "user": {"login": "octocat", "site_admin": False},
+            "milestone": None,
+        }
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={"total_count": 1, "incomplete_results": False, "items": [item]},
+        )
+
+        with patch("github_api_client.resources.search._STREAM_MIN_BYTES", 0):
+            with GitHub(token=None) as gh:
+                assert list(gh.search.issues("bug")) == [item]
+
+    @pytest.mark.skipif(not HAS_IJSON, reason="ijson is not installed")
+    def test_search_small_page_is_not_streamed(self, httpx_mock: HTTPXMock):
+        """Pages below the streaming threshold are decoded whole."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+        )
+
+        with patch("github_api_client.resources.search.ijson.parse") as parse:
+            with GitHub(token=None) as gh:
+                assert list(gh.search.issues("bug")) == [{"id": 1}]
+        parse.assert_not_called()
+
+    def test_search_error_raises(self, httpx_mock: HTTPXMock):
+        """Search raises API errors from a streamed page."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            status_code=404,
+            json={"message": "Not Found"},
+        )
+
+        with GitHub(token=None) as gh:
+            with pytest.raises(NotFoundError):
+                list(gh.search.issues("bug"))
+
+    def test_search_pagination_prefetch(self, httpx_mock: HTTPXMock):
+        """Prefetching search follows rel="next" links and keeps result order."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100"
+        for page, start, stop in [(1, 0, 100), (2, 100, 200), (3, 200, 250)]:
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                headers={"Link": f'<{base_url}&page={page + 1}>; rel="next"'} if page < 3 else {},
+                json={
+                    "total_count": 250,
+                    "incomplete_results": False,
+                    "items": [{"id": i} for i in range(start, stop)],
+                },
+            )
+
+        with GitHub(token=None) as gh:
+            results = list(gh.search.issues("bug", prefetch=True))
+            assert [item["id"] for item in results] == list(range(250))
+
+    def test_search_pages(self, httpx_mock: HTTPXMock):
+        """Search pages yields one list of results per page."""
+        base_url = "https://api.github.com/search/code?q=def&order=desc&per_page=100"
+        httpx_mock.add_response(
+            url=f"{base_url}&page=1",
+            headers={"Link": f'<{base_url}&page=2>; rel="next"'},
+            json={"total_count": 150, "items": [{"id": i} for i in range(100)]},
+        )
+        httpx_mock.add_response(
+            url=f"{base_url}&page=2",
+            json={"total_count": 150, "items": [{"id": i} for i in range(100, 150)]},
+        )
+
+        with GitHub(token=None) as gh:
+            pages = list(gh.search.pages("code", "def"))
+            assert [len(page) for page in pages] == [100, 50]
+
+    def test_search_pages_rejects_unknown_endpoint(self):
+        """Search pages rejects endpoints that aren't search endpoints."""
+        with GitHub(token=None) as gh:
+            with pytest.raises(ValueError, match="Unknown search endpoint"):
+                next(gh.search.pages("labels", "bug"))
+
+    def test_search_cache_reuses_results(self, httpx_mock: HTTPXMock):
+        """Repeated queries are served from the cache within the TTL."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+        )
+
+        with GitHub(token=None, search_cache_ttl=60) as gh:
+            assert list(gh.search.issues("bug")) == [{"id": 1}]
+            assert list(gh.search.issues("bug")) == [{"id": 1}]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_search_cache_returns_fresh_results(self, httpx_mock: HTTPXMock):
+        """Changing a result doesn't change what the cache returns later."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+        )
+
+        with GitHub(token=None, search_cache_ttl=60) as gh:
+            for item in gh.search.issues("bug"):
+                item["id"] = 2
+            assert list(gh.search.issues("bug")) == [{"id": 1}]
+            next(gh.search.issues("bug"))["id"] = 3
+            assert list(gh.search.issues("bug")) == [{"id": 1}]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_search_cache_expires(self, httpx_mock: HTTPXMock):
+        """Cached results are fetched again once the TTL has passed."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+            is_reusable=True,
+        )
+
+        with GitHub(token=None, search_cache_ttl=60) as gh:
+            with patch("time.monotonic", return_value=0.0):
+                list(gh.search.issues("bug"))
+            with patch("time.monotonic", return_value=61.0):
+                list(gh.search.issues("bug"))
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_search_cache_skips_partial_reads(self, httpx_mock: HTTPXMock):
+        """Results are only cached once every page has been read."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={
+                "total_count": 2,
+                "incomplete_results": False,
+                "items": [{"id": 1}, {"id": 2}],
+            },
+            is_reusable=True,
+        )
+
+        with GitHub(token=None, search_cache_ttl=60) as gh:
+            assert next(gh.search.issues("bug")) == {"id": 1}
+            assert len(list(gh.search.issues("bug"))) == 2
+        assert len(httpx_mock.get_requests()) == 2
+
+
+class TestAsyncSearch:
+    """Tests for async search operations."""
+
+    @pytest.mark.asyncio
+    async def test_search_pagination(self, httpx_mock: HTTPXMock):
+        """Async search paginates through streamed results."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100"
+        for page, start, stop in [(1, 0, 100), (2, 100, 150)]:
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                headers={"Link": f'<{base_url}&page=2>; rel="next"'} if page == 1 else {},
+                json={
+                    "total_count": 150,
+                    "incomplete_results": False,
+                    "items": [{"id": i} for i in range(start, stop)],
+                },
+            )
+
+        async with AsyncGitHub(token=None) as gh:
+            results = [item async for item in gh.search.issues("bug")]
+            assert [item["id"] for item in results] == list(range(150))
+
+    @pytest.mark.asyncio
+    async def test_search_pagination_batch(self, httpx_mock: HTTPXMock):
+        """Async batch search fetches remaining pages and keeps result order."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100"
+        for page, start, stop in [(1, 0, 100), (2, 100, 200), (3, 200, 250)]:
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                json={
+                    "total_count": 250,
+                    "incomplete_results": False,
+                    "items": [{"id": i} for i in range(start, stop)],
+                },
+            )
+
+        async with AsyncGitHub(token=None) as gh:
+            results = [item async for item in gh.search.issues("bug", batch=True)]
+            assert [item["id"] for item in results] == list(range(250))
+
+    @pytest.mark.asyncio
+    async def test_search_pagination_batch_is_bounded(self, httpx_mock: HTTPXMock):
+        """Batch search keeps no more than five pages in flight or unread."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=1"
+        for page in range(1, 11):
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                json={"total_count": 10, "incomplete_results": False, "items": [{"id": page}]},
+            )
+
+        async with AsyncGitHub(token=None) as gh:
+            results = gh.search.issues("bug", batch=True, per_page=1)
+            assert (await results.__anext__())["id"] == 1
+            assert (await results.__anext__())["id"] == 2
+            for _ in range(10):
+                await asyncio.sleep(0)
+            # Pages 3 to 7 are in the window; 8 to 10 wait for the consumer
+            assert len(httpx_mock.get_requests()) == 7
+            assert [item["id"] async for item in results] == list(range(3, 11))
+
+    @pytest.mark.asyncio
+    async def test_search_cache_reuses_results(self, httpx_mock: HTTPXMock):
+        """Repeated async queries are served from the cache within the TTL."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+        )
+
+        async with AsyncGitHub(token=None, search_cache_ttl=60) as gh:
+            assert [item async for item in gh.search.issues("bug")] == [{"id": 1}]
+            assert [item async for item in gh.search.issues("bug")] == [{"id": 1}]
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_search_cache_returns_fresh_results(self, httpx_mock: HTTPXMock):
+        """Changing an async result doesn't change what the cache returns later."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+        )
+
+        async with AsyncGitHub(token=None, search_cache_ttl=60) as gh:
+            async for item in gh.search.issues("bug"):
+                item["id"] = 2
+            assert [item async for item in gh.search.issues("bug")] == [{"id": 1}]
+            (await gh.search.issues("bug").__anext__())["id"] = 3
+            assert [item async for item in gh.search.issues("bug")] == [{"id": 1}]
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_search_conditional_request(self, httpx_mock: HTTPXMock):
+        """Repeat async searches send the page ETag and reuse the items on 304."""
+        url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1"
+        httpx_mock.add_response(
+            url=url,
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+            headers={"ETag": '"abc"'},
+        )
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"abc"'})
+
+        async with AsyncGitHub(token=None) as gh:
+            assert [item async for item in gh.search.issues("bug")] == [{"id": 1}]
+            assert [item async for item in gh.search.issues("bug")] == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_search_pagination_prefetch(self, httpx_mock: HTTPXMock):
+        """Async prefetching search follows rel="next" links and keeps result order."""
+        base_url = "https://api.github.com/search/issues?q=bug&order=desc&per_page=100"
+        for page, start, stop in [(1, 0, 100), (2, 100, 200), (3, 200, 250)]:
+            httpx_mock.add_response(
+                url=f"{base_url}&page={page}",
+                headers={"Link": f'<{base_url}&page={page + 1}>; rel="next"'} if page < 3 else {},
+                json={
+                    "total_count": 250,
+                    "incomplete_results": False,
+                    "items": [{"id": i} for i in range(start, stop)],
+                },
+            )
+
+        async with AsyncGitHub(token=None) as gh:
+            results = [item async for item in gh.search.issues("bug", prefetch=True)]
+            assert [item["id"] for item in results] == list(range(250))
+
+    @pytest.mark.asyncio
+    async def test_search_pages(self, httpx_mock: HTTPXMock):
+        """Async search pages yields one list of results per page."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/users?q=tom&order=desc&per_page=100&page=1",
+            json={"total_count": 2, "items": [{"id": 1}, {"id": 2}]},
+        )
+
+        async with AsyncGitHub(token=None) as gh:
+            pages = [page async for page in gh.search.pages("users", "tom")]
+            assert pages == [[{"id": 1}, {"id": 2}]]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_share_requests(self, httpx_mock: HTTPXMock):
+        """Identical searches running concurrently send each page request once."""
+        httpx_mock.add_response(
+            url="https://api.github.com/search/issues?q=bug&order=desc&per_page=100&page=1",
+            json={"total_count": 1, "incomplete_results": False, "items": [{"id": 1}]},
+        )
+
+        async def search(gh: AsyncGitHub) -> list[dict]:
+            return [item async for item in gh.search.issues("bug")]
+
+        with patch("github_api_client.resources.search.HAS_IJSON", False):
+            async with AsyncGitHub(token=None) as gh:
+                results = await asyncio.gather(search(gh), search(gh))
+        assert results == [[{"id": 1}], [{"id": 1}]]
+        assert len(httpx_mock.get_requests()) == 1